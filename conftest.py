@@ -0,0 +1,78 @@
+"""
+Shared pytest fixtures for the Temple Run test scripts
+
+Living at the repository root, this file also makes pytest put the project
+directory on sys.path, so the test modules import config/modules/utils directly
+without adjusting sys.path themselves (run as scripts, Python adds it anyway).
+"""
+
+import os
+
+# No sound card on CI or headless hosts; without a driver the mixer never opens
+# and every SoundManager call raises pygame.error. Must be set before pygame initialises
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+from utils.bytecode import precompile
+
+def pytest_addoption(parser):
+    """Command-line switches for the hardware-dependent tests"""
+    parser.addoption("--run-camera", action="store_true",
+                     help="also run tests marked 'camera' (needs a webcam or phone camera)")
+
+def pytest_configure(config):
+    """Register the markers used by the test scripts and warm the bytecode cache"""
+    config.addinivalue_line("markers", "camera: needs a webcam or phone camera (opt in with --run-camera)")
+    
+    # Compile once in the controlling process so pytest-xdist workers all
+    # load cached bytecode instead of racing to compile the same files
+    if not hasattr(config, "workerinput"):
+        precompile()
+
+def pytest_collection_modifyitems(config, items):
+    """Skip camera tests unless --run-camera was given"""
+    if config.getoption("--run-camera"):
+        return
+    
+    skip_camera = pytest.mark.skip(reason="needs a camera; run with --run-camera")
+    for item in items:
+        if "camera" in item.keywords:
+            item.add_marker(skip_camera)
+
+@pytest.fixture(scope="session")
+def parallax_background():
+    """Parallax background used by the game, built once per test session"""
+    from modules.background_simple import ParallaxBackground
+    return ParallaxBackground()
+
+@pytest.fixture(scope="session")
+def gesture_controller():
+    """MediaPipe gesture controller, built once per test session"""
+    from modules.gesture_control import HandGestureController
+    controller = HandGestureController()
+    yield controller
+    if controller.camera_active:
+        controller.cleanup()
+
+@pytest.fixture(scope="session")
+def sound_manager():
+    """Global sound manager instance"""
+    from utils.game_utils import sound_manager
+    return sound_manager
+
+@pytest.fixture(scope="module")
+def keyboard_controller():
+    """Keyboard gesture simulator, cleaned up after the module's tests"""
+    from modules.keyboard_gesture_control import KeyboardGestureController
+    controller = KeyboardGestureController()
+    yield controller
+    controller.cleanup()
+
+@pytest.fixture(scope="module")
+def opencv_controller():
+    """OpenCV gesture controller, cleaned up after the module's tests"""
+    from modules.opencv_gesture_control import OpenCVGestureController
+    controller = OpenCVGestureController()
+    yield controller
+    controller.cleanup()
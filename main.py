@@ -9,7 +9,7 @@ import pygame
 from config.game_config import *
 from modules.player import Player
 from modules.obstacle import ObstacleManager
-from utils.game_utils import init_pygame_mixer, draw_score, create_background
+from utils.game_utils import init_pygame_mixer, draw_score, create_background, get_font
 
 def reset_game():
     """Reset the game state"""
@@ -55,7 +55,7 @@ def main():
                     player, obstacle_manager, score, game_over = reset_game()
           # Update game objects if not game over
         if not game_over:
-            player.update()
+            player.update(dt)
             obstacle_manager.update(dt)
             
             # Check collisions
@@ -87,18 +87,18 @@ def main():
                 screen.blit(overlay, (0, 0))
                 
                 # Draw "GAME OVER" text
-                font_large = pygame.font.Font(None, 72)
+                font_large = get_font(72)
                 text_game_over = font_large.render("GAME OVER", True, RED)
                 text_rect = text_game_over.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40))
                 screen.blit(text_game_over, text_rect)
                 
                 # Draw score
-                font_score = pygame.font.Font(None, 48)
+                font_score = get_font(48)
                 score_text = font_score.render(f"Final Score: {int(score)}", True, WHITE)
                 score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
                 screen.blit(score_text, score_rect)
                   # Draw instructions
-                font_small = pygame.font.Font(None, 36)
+                font_small = get_font(36)
                 instruction1 = font_small.render("Press 'S' to restart", True, WHITE)
                 inst_rect1 = instruction1.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
                 screen.blit(instruction1, inst_rect1)
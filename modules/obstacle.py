@@ -8,6 +8,9 @@ import random
 import math
 from config.game_config import *
 
+# |cos| of every whole-degree coin rotation, computed once in a single numpy call
+COIN_ROTATION_FACTORS = tuple(np.abs(np.cos(np.deg2rad(np.arange(360)))).tolist())
+
 class Obstacle:
     def __init__(self, obstacle_type="rock"):
         self.type = obstacle_type
@@ -51,6 +54,12 @@ class Obstacle:
     
     def draw(self, frame):
         """Draw obstacle with 3D perspective effect"""
+        # Skip the cv2 calls entirely when the obstacle is fully outside the frame
+        x0 = int(self.x)
+        y0 = int(self.y)
+        if x0 + self.width <= 0 or x0 >= WINDOW_WIDTH or y0 + self.height <= 0 or y0 >= WINDOW_HEIGHT:
+            return frame
+        
         try:
             if self.type == "fire":
                 # Animated fire effect
@@ -115,7 +124,7 @@ class Coin:
             self.x -= self.speed * speed_multiplier * dt * 60
             
             # Animate rotation and scaling
-            self.rotation += 5
+            self.rotation = (self.rotation + 5) % 360
             self.scale_factor = 1.0 + 0.2 * math.sin(cv2.getTickCount() / 500)
             
             # Floating effect
@@ -131,8 +140,14 @@ class Coin:
             center_x = int(self.x + self.width // 2)
             center_y = int(self.y + self.height // 2)
             
+            # Skip offscreen coins before calling into cv2
+            half_size = actual_size // 2
+            if (center_x + half_size <= 0 or center_x - half_size >= WINDOW_WIDTH or
+                    center_y + half_size <= 0 or center_y - half_size >= WINDOW_HEIGHT):
+                return frame
+            
             # Draw rotating coin (ellipse that changes width based on rotation)
-            rotation_factor = abs(math.cos(math.radians(self.rotation)))
+            rotation_factor = COIN_ROTATION_FACTORS[self.rotation]
             ellipse_width = int(actual_size * rotation_factor)
             
             if ellipse_width > 5:  # Only draw if visible
@@ -202,8 +217,9 @@ class ObstacleManager:
     def draw(self, frame):
         """Draw all obstacles and coins"""
         # Draw obstacles (back to front for proper layering)
-        sorted_obstacles = sorted(self.obstacles, key=lambda x: x.distance, reverse=True)
-        for obstacle in sorted_obstacles:
+        # All obstacles spawn at the right edge and move at the same speed, so
+        # spawn order is already nearest-first; walk it backwards instead of sorting
+        for obstacle in reversed(self.obstacles):
             frame = obstacle.draw(frame)
         
         # Draw coins
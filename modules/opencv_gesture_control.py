@@ -6,9 +6,9 @@ Uses phone camera via IP Webcam app for gesture recognition
 import cv2
 import numpy as np
 import time
+import threading
+from collections import deque
 from enum import Enum
-import requests
-from urllib.parse import urlparse
 
 class GestureType(Enum):
     """Enumeration of recognized gestures"""
@@ -17,6 +17,51 @@ class GestureType(Enum):
     CROUCH = "crouch"
     UNKNOWN = "unknown"
 
+class LatestFrameReader:
+    """
+    Reads a VideoCapture on a daemon thread and keeps only the newest frame
+    Mirrors the start()/read()/stop() API of imutils' WebcamVideoStream
+    """
+    
+    def __init__(self, cap):
+        self.cap = cap
+        self.frame = None
+        self.frame_id = 0
+        self.stopped = False
+        self.condition = threading.Condition()
+        self.thread = None
+    
+    def start(self):
+        """Start the background capture thread"""
+        self.thread = threading.Thread(target=self.update, daemon=True)
+        self.thread.start()
+        return self
+    
+    def update(self):
+        """Capture loop: overwrite the single frame slot with each new frame"""
+        while not self.stopped:
+            ret, frame = self.cap.read()
+            with self.condition:
+                if not ret:
+                    self.stopped = True
+                else:
+                    self.frame = frame
+                    self.frame_id += 1
+                self.condition.notify_all()
+    
+    def read(self, newer_than=None, timeout=2.0):
+        """Return (frame, frame_id); with newer_than, wait up to timeout for a newer frame"""
+        with self.condition:
+            if newer_than is not None:
+                self.condition.wait_for(lambda: self.frame_id != newer_than or self.stopped, timeout)
+            return self.frame, self.frame_id
+    
+    def stop(self):
+        """Stop the capture thread"""
+        self.stopped = True
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+
 class OpenCVGestureController:
     """
     OpenCV-based gesture controller using phone camera via IP Webcam
@@ -34,8 +79,14 @@ class OpenCVGestureController:
         # Gesture recognition parameters
         self.current_gesture = GestureType.IDLE
         self.gesture_confidence = 0.0
-        self.gesture_history = []
         self.history_size = 5
+        self.gesture_history = deque()
+        
+        # Running per-gesture totals over the history window, indexed by GestureType order
+        self.gesture_ids = {gesture: i for i, gesture in enumerate(GestureType)}
+        self.gesture_by_id = list(GestureType)
+        self.history_counts = np.zeros(len(GestureType), dtype=np.int32)
+        self.history_conf_sums = np.zeros(len(GestureType), dtype=np.float32)
         
         # Hand detection parameters
         self.skin_lower = np.array([0, 20, 70], dtype=np.uint8)
@@ -43,9 +94,18 @@ class OpenCVGestureController:
         
         # Gesture thresholds
         self.min_contour_area = 3000
+        self.defect_depth_threshold = 8000
         self.finger_threshold = 0.8
         self.fist_threshold = 0.3
         
+        # Size of the detection frame relative to the camera frame; the pixel
+        # thresholds above are tuned for full size and scaled by this
+        self.detection_scale = 1.0
+        
+        # Bounding box of the last detected hand, used to narrow the next search
+        self.hand_bbox = None
+        self.roi_margin = 20
+        
         # Timing for gesture actions
         self.last_gesture_time = 0
         self.gesture_cooldown = 0.5
@@ -66,17 +126,17 @@ class OpenCVGestureController:
             if isinstance(camera_source, str) and 'http' in camera_source:
                 # IP Webcam URL
                 self.ip_webcam_url = camera_source
-                if not self.ip_webcam_url.endswith('/video'):
+                if '/video' not in self.ip_webcam_url:
                     self.ip_webcam_url += '/video'
                 
-                # Test connection
-                response = requests.get(self.ip_webcam_url, timeout=5, stream=True)
-                if response.status_code == 200:
-                    self.cap = cv2.VideoCapture(self.ip_webcam_url)
-                    print(f"✓ Connected to IP Webcam: {camera_source}")
-                else:
+                # Open the stream through FFmpeg (so OPENCV_FFMPEG_CAPTURE_OPTIONS
+                # applies) with a short open timeout and confirm it delivers a frame
+                self.cap = cv2.VideoCapture(self.ip_webcam_url, cv2.CAP_FFMPEG,
+                                            [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, 3000])
+                if not self.cap.isOpened() or not self.cap.read()[0]:
                     print(f"❌ Failed to connect to IP Webcam: {camera_source}")
                     return False
+                print(f"✓ Connected to IP Webcam: {camera_source}")
             else:
                 # Regular camera device
                 self.cap = cv2.VideoCapture(camera_source)
@@ -105,6 +165,12 @@ class OpenCVGestureController:
             print(f"❌ Error initializing camera: {e}")
             return False
     
+    def set_buffer_size(self, size):
+        """Limit the capture's internal frame queue so reads return the newest frame"""
+        if not self.cap:
+            return False
+        return self.cap.set(cv2.CAP_PROP_BUFFERSIZE, size)
+    
     def detect_skin(self, frame):
         """Detect skin-colored regions in the frame"""
         # Convert to HSV color space
@@ -125,7 +191,44 @@ class OpenCVGestureController:
     
     def find_hand_contour(self, mask):
         """Find the largest hand contour in the mask"""
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        hand_contour = None
+        
+        # Search around the previous hand position first, expanded by a margin
+        if self.hand_bbox is not None:
+            x, y, w, h = self.hand_bbox
+            margin = round(self.roi_margin * self.detection_scale)
+            roi_x = max(0, x - margin)
+            roi_y = max(0, y - margin)
+            roi_mask = mask[roi_y:y + h + margin, roi_x:x + w + margin]
+            hand_contour = self.largest_contour(roi_mask, (roi_x, roi_y))
+            
+            # A contour cut off by an ROI edge (one that isn't also a frame edge)
+            # has straight false sides that skew solidity and defects
+            if hand_contour is not None and self.touches_roi_edge(
+                    hand_contour, (roi_x, roi_y) + roi_mask.shape[1::-1], mask.shape):
+                hand_contour = None
+        
+        # Fall back to the full mask if the hand left or outgrew the region
+        if hand_contour is None:
+            hand_contour = self.largest_contour(mask)
+        
+        self.hand_bbox = cv2.boundingRect(hand_contour) if hand_contour is not None else None
+        return hand_contour
+    
+    def touches_roi_edge(self, contour, roi, frame_shape):
+        """Whether the contour's bounding box reaches an ROI border that lies inside the frame"""
+        x, y, w, h = cv2.boundingRect(contour)
+        roi_x, roi_y, roi_w, roi_h = roi
+        frame_h, frame_w = frame_shape[:2]
+        return ((x <= roi_x and roi_x > 0) or
+                (y <= roi_y and roi_y > 0) or
+                (x + w >= roi_x + roi_w and roi_x + roi_w < frame_w) or
+                (y + h >= roi_y + roi_h and roi_y + roi_h < frame_h))
+    
+    def largest_contour(self, mask, offset=(0, 0)):
+        """Return the largest contour in the mask (in full-frame coordinates) if big enough"""
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE,
+                                       offset=offset)
         
         if not contours:
             return None
@@ -134,7 +237,7 @@ class OpenCVGestureController:
         hand_contour = max(contours, key=cv2.contourArea)
         
         # Check if contour is large enough
-        if cv2.contourArea(hand_contour) < self.min_contour_area:
+        if cv2.contourArea(hand_contour) < self.min_contour_area * self.detection_scale ** 2:
             return None
         
         return hand_contour
@@ -160,7 +263,7 @@ class OpenCVGestureController:
             far = tuple(contour[f][0])
             
             # Calculate the distance from far point to convex hull
-            if d > 8000:  # Threshold for significant defect
+            if d > self.defect_depth_threshold * self.detection_scale:  # Threshold for significant defect
                 finger_count += 1
         
         # Adjust finger count (convexity defects count gaps between fingers)
@@ -199,55 +302,67 @@ class OpenCVGestureController:
     
     def smooth_gesture(self, gesture, confidence):
         """Smooth gesture recognition using history"""
+        # Evict the oldest entry from the running totals once the window is full
+        if len(self.gesture_history) == self.history_size:
+            old_gesture, old_confidence = self.gesture_history.popleft()
+            old_id = self.gesture_ids[old_gesture]
+            self.history_counts[old_id] -= 1
+            self.history_conf_sums[old_id] -= old_confidence
+        
         # Add to history
         self.gesture_history.append((gesture, confidence))
+        new_id = self.gesture_ids[gesture]
+        self.history_counts[new_id] += 1
+        self.history_conf_sums[new_id] += confidence
         
-        # Keep only recent history
-        if len(self.gesture_history) > self.history_size:
-            self.gesture_history.pop(0)
-        
-        # Count occurrences of each gesture in history
-        gesture_counts = {}
-        total_confidence = 0
-        
-        for hist_gesture, hist_confidence in self.gesture_history:
-            if hist_gesture not in gesture_counts:
-                gesture_counts[hist_gesture] = {'count': 0, 'confidence': 0}
-            gesture_counts[hist_gesture]['count'] += 1
-            gesture_counts[hist_gesture]['confidence'] += hist_confidence
-            total_confidence += hist_confidence
-        
-        # Find most frequent gesture with highest confidence
-        best_gesture = GestureType.IDLE
-        best_score = 0
-        
-        for gest, data in gesture_counts.items():
-            score = data['count'] * data['confidence']
-            if score > best_score:
-                best_gesture = gest
-                best_score = score
+        # Most frequent gesture weighted by its total confidence
+        scores = self.history_counts * self.history_conf_sums
+        best_id = int(scores.argmax())
+        best_gesture = self.gesture_by_id[best_id] if scores[best_id] > 0 else GestureType.IDLE
         
         # Calculate smoothed confidence
-        smoothed_confidence = total_confidence / len(self.gesture_history)
+        smoothed_confidence = float(self.history_conf_sums.sum()) / len(self.gesture_history)
         
         return best_gesture, smoothed_confidence
     
-    def process_frame(self):
-        """Process one frame from the camera and detect gestures"""
-        if not self.camera_active or not self.cap:
-            return None, GestureType.IDLE, 0.0
+    def process_frame(self, frame=None):
+        """Process one frame (read from the camera unless given) and detect gestures"""
+        if frame is None:
+            if not self.camera_active or not self.cap:
+                return None, GestureType.IDLE, 0.0
+            
+            ret, frame = self.cap.read()
+            if not ret:
+                return None, GestureType.IDLE, 0.0
         
-        ret, frame = self.cap.read()
-        if not ret:
-            return None, GestureType.IDLE, 0.0
+        # Flip frame horizontally for mirror effect
+        frame = cv2.flip(frame, 1)
         
+        return self.recognize(frame, frame, 1.0)
+    
+    def process_frame_small(self, frame, width=160):
+        """Like process_frame(frame), but detect on a copy downscaled to the given width"""
         # Flip frame horizontally for mirror effect
         frame = cv2.flip(frame, 1)
         
+        # Skin detection needs colour, so shrink the BGR frame rather than going to grayscale
+        scale = width / frame.shape[1]
+        small = cv2.resize(frame, (width, round(frame.shape[0] * scale)),
+                           interpolation=cv2.INTER_AREA)
+        
+        return self.recognize(frame, small, scale)
+    
+    def recognize(self, frame, detection_frame, scale):
+        """Detect the gesture in detection_frame and annotate frame (scale = detection/frame size)"""
+        # A bbox from a different detection size would point at the wrong region
+        if scale != self.detection_scale:
+            self.detection_scale = scale
+            self.hand_bbox = None
+        
         self.frame_count += 1
         
         # Detect skin regions
-        skin_mask = self.detect_skin(frame)
+        skin_mask = self.detect_skin(detection_frame)
         
         # Find hand contour
         hand_contour = self.find_hand_contour(skin_mask)
@@ -257,13 +372,15 @@ class OpenCVGestureController:
         confidence = 0.0
         
         if hand_contour is not None:
-            gesture, confidence = self.analyze_hand_gesture(hand_contour, frame)
+            gesture, confidence = self.analyze_hand_gesture(hand_contour, detection_frame)
             
             # Apply smoothing
             gesture, confidence = self.smooth_gesture(gesture, confidence)
             
             # Draw hand contour and debug info
             if self.show_debug:
+                if scale != 1.0:
+                    hand_contour = (hand_contour / scale).astype(np.int32)
                 cv2.drawContours(frame, [hand_contour], -1, (0, 255, 0), 2)
                 
                 # Draw convex hull
@@ -4,10 +4,53 @@ Enhanced Player class with animation and improved physics
 
 import cv2
 import numpy as np
-import math
 from config.game_config import *
+from utils.numba_compat import njit
+
+def allocate_aligned_frames(count, height, width, channels=3, alignment=32):
+    """Allocate zeroed (count, height, width, channels) uint8 frames whose rows start on alignment-byte boundaries"""
+    row_bytes = width * channels
+    row_stride = -(-row_bytes // alignment) * alignment  # Round up to the alignment
+    nbytes = count * height * row_stride
+    
+    # Over-allocate and offset into the buffer so the first row is aligned
+    raw = np.zeros(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    
+    return np.ndarray((count, height, width, channels), dtype=np.uint8, buffer=raw,
+                      offset=offset, strides=(height * row_stride, row_stride, channels, 1))
+
+# The config constants are arguments, not globals: Numba freezes globals into the
+# cached binary and would keep using old values after game_config.py changes
+@njit(cache=True, fastmath=True)
+def physics_step(y, velocity_y, is_jumping, is_falling, gravity, max_fall_speed, ground_y):
+    """Advance vertical player physics by one tick, returning the new (y, velocity_y, is_jumping, is_falling)"""
+    # Apply gravity
+    if is_jumping or is_falling:
+        velocity_y += gravity
+        if velocity_y > max_fall_speed:
+            velocity_y = max_fall_speed
+    
+    # Update position
+    y += velocity_y
+    
+    # Ground collision with improved detection
+    if y >= ground_y:
+        y = ground_y
+        if velocity_y > 0:  # Was falling
+            velocity_y = 0.0
+            is_jumping = False
+            is_falling = False
+    elif velocity_y > 0:  # Moving downward
+        is_falling = True
+    
+    return float(y), float(velocity_y), is_jumping, is_falling
 
 class Player:
+    # Limb offsets per running frame (5*sin and 3*cos at quarter turns)
+    LEG_OFFSETS = (0, 5, 0, -5)
+    ARM_OFFSETS = (3, 0, -3, 0)
+    
     def __init__(self):
         self.x = PLAYER_START_X
         self.y = PLAYER_START_Y
@@ -18,22 +61,34 @@ class Player:
         self.is_falling = False
         
         # Animation properties
-        self.animation_frame = 0.0
-        self.animation_speed = PLAYER_ANIMATION_SPEED
+        # Animation position is 8.8 fixed point (frame index in the high bits) so it
+        # wraps with a single AND; running_frames must stay a power of two
         self.running_frames = 4  # Number of running animation frames
+        self.animation_frame = 0
+        self.animation_speed = round(PLAYER_ANIMATION_SPEED * 256)
+        self.animation_mask = (self.running_frames << 8) - 1
         
         # Visual effects
         self.shake_offset_x = 0
         self.shake_offset_y = 0
         
+        # Precomputed (dx, dy) jitter pairs cycled by add_screen_shake
+        self.shake_table = np.random.randint(-CAMERA_SHAKE_INTENSITY, CAMERA_SHAKE_INTENSITY,
+                                             size=(1024, 2), dtype=np.int16).tolist()
+        self.shake_index = 0
+        
         # Create simple sprite frames (can be replaced with actual sprites)
         self.sprite_frames = self.create_sprite_frames()
         
+        # Separate alpha plane per frame: True where the sprite has pixels
+        self.sprite_alpha = self.sprite_frames.any(axis=3, keepdims=True)
+        
     def create_sprite_frames(self):
         """Create simple animated sprite frames"""
-        frames = []
+        # One (N, H, W, 3) block with 32-byte aligned rows; indexing a frame returns a view
+        frames = allocate_aligned_frames(self.running_frames, self.height, self.width)
         for i in range(self.running_frames):
-            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+            frame = frames[i]
             
             # Body
             body_color = BLUE
@@ -43,16 +98,14 @@ class Player:
             cv2.circle(frame, (30, 15), 12, body_color, -1)
             
             # Legs (animated)
-            leg_offset = int(5 * math.sin(i * math.pi / 2))
+            leg_offset = self.LEG_OFFSETS[i]
             cv2.rectangle(frame, (20 + leg_offset, 70), (25 + leg_offset, 85), body_color, -1)
             cv2.rectangle(frame, (35 - leg_offset, 70), (40 - leg_offset, 85), body_color, -1)
             
             # Arms (animated)
-            arm_offset = int(3 * math.cos(i * math.pi / 2))
+            arm_offset = self.ARM_OFFSETS[i]
             cv2.rectangle(frame, (10 + arm_offset, 30), (15 + arm_offset, 50), body_color, -1)
             cv2.rectangle(frame, (45 - arm_offset, 30), (50 - arm_offset, 50), body_color, -1)
-            
-            frames.append(frame)
         
         return frames
     
@@ -68,40 +121,33 @@ class Player:
         """Enhanced update with improved physics"""
         # Update animation
         if not self.is_jumping:
-            self.animation_frame += self.animation_speed
-            if self.animation_frame >= self.running_frames:
-                self.animation_frame = 0
-        
-        # Apply gravity
-        if self.is_jumping or self.is_falling:
-            self.velocity_y += GRAVITY
-            if self.velocity_y > MAX_FALL_SPEED:
-                self.velocity_y = MAX_FALL_SPEED
+            self.animation_frame = (self.animation_frame + self.animation_speed) & self.animation_mask
         
-        # Update position
-        self.y += self.velocity_y
+        # Apply gravity, move and resolve ground contact
+        self.y, self.velocity_y, self.is_jumping, self.is_falling = physics_step(
+            float(self.y), float(self.velocity_y), self.is_jumping, self.is_falling,
+            float(GRAVITY), float(MAX_FALL_SPEED), float(PLAYER_START_Y))
         
-        # Ground collision with improved detection
-        ground_y = PLAYER_START_Y
-        if self.y >= ground_y:
-            self.y = ground_y
-            if self.velocity_y > 0:  # Was falling
-                self.velocity_y = 0
-                self.is_jumping = False
-                self.is_falling = False
-        elif self.velocity_y > 0:  # Moving downward
-            self.is_falling = True
+        # Decay screen shake at the actual tick rate
+        if self.shake_offset_x or self.shake_offset_y:
+            self.update_screen_shake(dt)
     
     def add_screen_shake(self, intensity=CAMERA_SHAKE_INTENSITY):
         """Add screen shake effect"""
-        self.shake_offset_x = np.random.randint(-intensity, intensity)
-        self.shake_offset_y = np.random.randint(-intensity, intensity)
+        if intensity != CAMERA_SHAKE_INTENSITY:
+            self.shake_offset_x = np.random.randint(-intensity, intensity)
+            self.shake_offset_y = np.random.randint(-intensity, intensity)
+            return
+        
+        self.shake_offset_x, self.shake_offset_y = self.shake_table[self.shake_index & 1023]
+        self.shake_index += 1
     
     def update_screen_shake(self, dt):
         """Update screen shake effect"""
-        # Gradually reduce shake
-        self.shake_offset_x *= 0.9
-        self.shake_offset_y *= 0.9
+        # Gradually reduce shake (0.9 per 60 FPS frame, independent of framerate)
+        decay = 0.9 ** (dt * 60)
+        self.shake_offset_x *= decay
+        self.shake_offset_y *= decay
         
         if abs(self.shake_offset_x) < 0.5:
             self.shake_offset_x = 0
@@ -117,41 +163,27 @@ class Player:
         # Get current sprite frame
         if self.is_jumping:
             # Use a specific jump frame (could be different sprite)
-            current_frame = self.sprite_frames[1]  # Use frame 1 for jump
+            frame_index = 1  # Use frame 1 for jump
         else:
-            frame_index = int(self.animation_frame) % len(self.sprite_frames)
-            current_frame = self.sprite_frames[frame_index]
+            frame_index = self.animation_frame >> 8
+        current_frame = self.sprite_frames[frame_index]
+        current_alpha = self.sprite_alpha[frame_index]
         
-        # Draw the sprite
-        try:
-            # Ensure we don't draw outside frame bounds
-            sprite_h, sprite_w = current_frame.shape[:2]
-            frame_h, frame_w = frame.shape[:2]
-            
-            # Calculate drawing bounds
-            start_x = max(0, draw_x)
-            start_y = max(0, draw_y)
-            end_x = min(frame_w, draw_x + sprite_w)
-            end_y = min(frame_h, draw_y + sprite_h)
-            
-            # Calculate sprite bounds
-            sprite_start_x = max(0, -draw_x)
-            sprite_start_y = max(0, -draw_y)
-            sprite_end_x = sprite_start_x + (end_x - start_x)
-            sprite_end_y = sprite_start_y + (end_y - start_y)
-            
-            if end_x > start_x and end_y > start_y:
-                frame[start_y:end_y, start_x:end_x] = current_frame[sprite_start_y:sprite_end_y, sprite_start_x:sprite_end_x]
-                
-        except Exception as e:
-            # Fallback to simple rectangle
-            cv2.rectangle(frame, 
-                         (draw_x, draw_y), 
-                         (draw_x + self.width, draw_y + self.height), 
-                         BLUE, -1)
+        # Draw the sprite, clipped against the frame using plain int arithmetic;
+        # the clamped bounds keep the slice assignment in range
+        frame_h = frame.shape[0]
+        frame_w = frame.shape[1]
+        sprite_x = 0 if draw_x >= 0 else -draw_x
+        sprite_y = 0 if draw_y >= 0 else -draw_y
+        dest_x = draw_x + sprite_x
+        dest_y = draw_y + sprite_y
+        visible_w = min(self.width - sprite_x, frame_w - dest_x)
+        visible_h = min(self.height - sprite_y, frame_h - dest_y)
         
-        # Update screen shake
-        self.update_screen_shake(1/60)  # Assume 60 FPS for shake decay
+        if visible_w > 0 and visible_h > 0:
+            np.copyto(frame[dest_y:dest_y + visible_h, dest_x:dest_x + visible_w],
+                      current_frame[sprite_y:sprite_y + visible_h, sprite_x:sprite_x + visible_w],
+                      where=current_alpha[sprite_y:sprite_y + visible_h, sprite_x:sprite_x + visible_w])
         
         return frame
     
@@ -5,6 +5,7 @@ Enhanced UI Module for Temple Run
 import cv2
 import numpy as np
 import pygame
+from collections import OrderedDict
 from config.game_config import *
 
 class GameUI:
@@ -24,6 +25,93 @@ class GameUI:
         self.coins_pos = (20, 90)
         self.speed_pos = (20, 130)
         
+        # Rendered HUD text tiles keyed by (text, color, scale, thickness), LRU-evicted
+        self.text_tile_cache = OrderedDict()
+        self.text_tile_cache_size = 64
+        
+        # Score/coins/speed block, composited onto the frame in one masked copy.
+        # Each 40 px line strip is only repainted when its text changes.
+        self.stats_origin = (0, 20)
+        self.stats_line_height = 40
+        self.stats_overlay = np.zeros((3 * self.stats_line_height, 400, 3), dtype=np.uint8)
+        self.stats_mask = np.zeros((3 * self.stats_line_height, 400, 1), dtype=bool)
+        self.stats_lines = [None, None, None]  # Last (text, color) painted per line
+        self.stats_values = [None, None, None]  # Last raw values, checked before formatting
+        
+        # Life indicator rendered once and stamped per life
+        self.heart_tile = np.zeros((21, 21, 3), dtype=np.uint8)
+        cv2.circle(self.heart_tile, (10, 10), 10, RED, -1)
+        self.heart_mask = self.heart_tile.any(axis=2, keepdims=True)
+        
+        # Controls hint for each input mode, keyed by gesture_control
+        self.controls_tiles = {
+            True: self.render_text_tile("G: Toggle Control | P: Pause | M: Mute | Q: Quit", 0.4, WHITE, 1),
+            False: self.render_text_tile("SPACE: Jump | G: Gesture | P: Pause | M: Mute | Q: Quit", 0.4, WHITE, 1),
+        }
+        
+        # Start screen blue gradient, laid out (W, H, RGB) for pygame.surfarray
+        intensity = (50 + np.arange(WINDOW_HEIGHT) / WINDOW_HEIGHT * 100).astype(np.uint8)
+        self.start_gradient = np.zeros((WINDOW_WIDTH, WINDOW_HEIGHT, 3), dtype=np.uint8)
+        self.start_gradient[..., 2] = intensity[None, :]
+        
+        # Reusable semi-transparent overlays for the game over and pause screens
+        self.game_over_overlay = self.create_overlay(180)
+        self.pause_overlay = self.create_overlay(128)
+        
+        # Pre-render static menu text as (surface, rect) pairs
+        center_x = WINDOW_WIDTH // 2
+        center_y = WINDOW_HEIGHT // 2
+        
+        self.game_over_texts = [
+            self.render_centered(self.pygame_font_large, "GAME OVER", (100, 0, 0), (center_x + 3, center_y - 97)),
+            self.render_centered(self.pygame_font_large, "GAME OVER", (255, 50, 50), (center_x, center_y - 100)),
+            self.render_centered(self.pygame_font_medium, "Press 'S' to Restart", GREEN, (center_x, center_y + 80)),
+            self.render_centered(self.pygame_font_medium, "Press 'Q' to Quit", WHITE, (center_x, center_y + 120)),
+        ]
+        self.new_high_score_text = self.render_centered(self.pygame_font_medium, "NEW HIGH SCORE!", YELLOW,
+                                                        (center_x, center_y))
+        
+        self.start_texts = [
+            self.render_centered(self.pygame_font_large, "TEMPLE RUN CV", YELLOW, (center_x, center_y - 100)),
+            self.render_centered(self.pygame_font_medium, "Enhanced Edition", WHITE, (center_x, center_y - 60)),
+        ]
+        instructions = [
+            "Press SPACE to Jump",
+            "Collect Coins for Points",
+            "Avoid Obstacles",
+            "",
+            "Press SPACE to Start"
+        ]
+        for i, instruction in enumerate(instructions):
+            if instruction:  # Skip empty strings
+                color = GREEN if "Start" in instruction else WHITE
+                self.start_texts.append(
+                    self.render_centered(self.pygame_font_small, instruction, color, (center_x, center_y + i * 30)))
+        
+        self.pause_texts = [
+            self.render_centered(self.pygame_font_large, "PAUSED", WHITE, (center_x, center_y)),
+            self.render_centered(self.pygame_font_medium, "Press 'P' to Resume", WHITE, (center_x, center_y + 50)),
+        ]
+        
+    def create_overlay(self, alpha):
+        """Create a full-window black overlay with the given surface alpha"""
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert()
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(alpha)
+        return overlay
+    
+    def render_centered(self, font, text, color, center):
+        """Render text once and return the surface with its rect centered on center"""
+        text_surface = font.render(text, True, color)
+        
+        # Match the display pixel format so later blits are plain copies
+        if pygame.display.get_surface() is not None:
+            text_surface = text_surface.convert_alpha()
+        
+        return text_surface, text_surface.get_rect(center=center)
+        
     def draw_text_opencv(self, frame, text, position, font=None, scale=1, color=WHITE, thickness=2):
         """Draw text using OpenCV"""
         if font is None:
@@ -31,6 +119,59 @@ class GameUI:
         cv2.putText(frame, text, position, font, scale, color, thickness)
         return frame
     
+    def get_text_tile(self, text, scale=1, color=WHITE, thickness=2):
+        """Get a pre-rendered text tile, rasterizing only on a cache miss"""
+        key = (text, color, scale, thickness)
+        cached = self.text_tile_cache.get(key)
+        if cached is None:
+            cached = self.render_text_tile(text, scale, color, thickness)
+            self.text_tile_cache[key] = cached
+            if len(self.text_tile_cache) > self.text_tile_cache_size:
+                self.text_tile_cache.popitem(last=False)
+        else:
+            self.text_tile_cache.move_to_end(key)
+        
+        return cached
+    
+    def update_stats_line(self, index, text, position, scale, color, thickness):
+        """Repaint one line of the stats overlay if its text or color changed"""
+        if self.stats_lines[index] == (text, color):
+            return
+        self.stats_lines[index] = (text, color)
+        
+        top = index * self.stats_line_height
+        strip = self.stats_overlay[top:top + self.stats_line_height]
+        strip[:] = 0
+        tile_position = (position[0] - self.stats_origin[0], position[1] - self.stats_origin[1] - top)
+        self.blit_text_tile(strip, self.get_text_tile(text, scale, color, thickness), tile_position)
+        self.stats_mask[top:top + self.stats_line_height] = strip.any(axis=2, keepdims=True)
+    
+    def blit_text_tile(self, frame, cached, position):
+        """Copy a pre-rendered text tile onto the frame with its baseline origin at position"""
+        tile, mask, (offset_x, offset_y) = cached
+        x = position[0] - offset_x
+        y = position[1] - offset_y
+        
+        # Clip the tile to the frame
+        frame_h, frame_w = frame.shape[:2]
+        tile_h, tile_w = tile.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(frame_w, x + tile_w), min(frame_h, y + tile_h)
+        if x1 > x0 and y1 > y0:
+            np.copyto(frame[y0:y1, x0:x1], tile[y0 - y:y1 - y, x0 - x:x1 - x],
+                      where=mask[y0 - y:y1 - y, x0 - x:x1 - x])
+        return frame
+    
+    def render_text_tile(self, text, scale, color, thickness):
+        """Rasterize text once into a tight BGR tile, its pixel mask and the baseline origin inside it"""
+        (text_w, text_h), baseline = cv2.getTextSize(text, self.font_medium, scale, thickness)
+        pad = thickness
+        tile = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad, 3), dtype=np.uint8)
+        origin = (pad, pad + text_h)
+        cv2.putText(tile, text, origin, self.font_medium, scale, color, thickness)
+        mask = tile.any(axis=2, keepdims=True)
+        return tile, mask, origin
+    
     def draw_text_pygame(self, surface, text, position, font=None, color=WHITE, background=None):
         """Draw text using Pygame (better quality)"""
         if font is None:
@@ -42,23 +183,39 @@ class GameUI:
     
     def draw_game_hud(self, frame, score, coins, speed_multiplier, lives=3, sound_muted=False, gesture_control=False):
         """Draw the main game HUD with sound and gesture control status"""
+        # Only format text for values that changed since the last frame
         # Score
-        score_text = f"Score: {score:,}"
-        self.draw_text_opencv(frame, score_text, self.score_pos, scale=0.8, thickness=2)
+        if score != self.stats_values[0]:
+            self.stats_values[0] = score
+            self.update_stats_line(0, f"Score: {score:,}", self.score_pos, 0.8, WHITE, 2)
         
         # Coins
-        coins_text = f"Coins: {coins}"
-        self.draw_text_opencv(frame, coins_text, self.coins_pos, scale=0.7, color=YELLOW, thickness=2)
+        if coins != self.stats_values[1]:
+            self.stats_values[1] = coins
+            self.update_stats_line(1, f"Coins: {coins}", self.coins_pos, 0.7, YELLOW, 2)
         
-        # Speed
-        speed_text = f"Speed: {speed_multiplier:.1f}x"
+        # Speed (shown to one decimal, so compare at that precision)
         speed_color = GREEN if speed_multiplier <= 2.0 else ORANGE if speed_multiplier <= 3.0 else RED
-        self.draw_text_opencv(frame, speed_text, self.speed_pos, scale=0.6, color=speed_color, thickness=2)
+        speed_key = (round(speed_multiplier, 1), speed_color)
+        if speed_key != self.stats_values[2]:
+            self.stats_values[2] = speed_key
+            self.update_stats_line(2, f"Speed: {speed_multiplier:.1f}x", self.speed_pos, 0.6, speed_color, 2)
+        
+        # Composite the stats block
+        x, y = self.stats_origin
+        h, w = self.stats_overlay.shape[:2]
+        np.copyto(frame[y:y + h, x:x + w], self.stats_overlay, where=self.stats_mask)
         
         # Lives (hearts)
         heart_x = WINDOW_WIDTH - 150
         for i in range(lives):
-            cv2.circle(frame, (heart_x + i * 30, 40), 10, RED, -1)
+            x = heart_x + i * 30 - 10
+            
+            # Clip the tile to the frame; hearts past the right edge are skipped
+            width = min(21, frame.shape[1] - x)
+            if width <= 0:
+                break
+            np.copyto(frame[30:51, x:x + width], self.heart_tile[:, :width], where=self.heart_mask[:, :width])
         
         # Sound status indicator
         if sound_muted:
@@ -83,12 +240,7 @@ class GameUI:
                             scale=0.5, color=gesture_color, thickness=2)
         
         # Controls hint
-        if gesture_control:
-            controls_text = "G: Toggle Control | P: Pause | M: Mute | Q: Quit"
-        else:
-            controls_text = "SPACE: Jump | G: Gesture | P: Pause | M: Mute | Q: Quit"
-        self.draw_text_opencv(frame, controls_text, (20, WINDOW_HEIGHT - 30), 
-                            scale=0.4, color=WHITE, thickness=1)
+        self.blit_text_tile(frame, self.controls_tiles[bool(gesture_control)], (20, WINDOW_HEIGHT - 30))
         
         return frame
     
@@ -110,25 +262,11 @@ class GameUI:
     def draw_game_over_screen(self, surface, final_score, high_score, coins):
         """Draw enhanced game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.game_over_overlay, (0, 0))
         
         # Game Over title with shadow effect
-        title_text = "GAME OVER"
-        title_color = (255, 50, 50)  # Bright red
-        shadow_color = (100, 0, 0)   # Dark red
-        
-        # Draw shadow
-        title_shadow = self.pygame_font_large.render(title_text, True, shadow_color)
-        title_rect_shadow = title_shadow.get_rect(center=(WINDOW_WIDTH//2 + 3, WINDOW_HEIGHT//2 - 97))
-        surface.blit(title_shadow, title_rect_shadow)
-        
-        # Draw main title
-        title_surface = self.pygame_font_large.render(title_text, True, title_color)
-        title_rect = title_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))
-        surface.blit(title_surface, title_rect)
+        for text_surface, text_rect in self.game_over_texts[:2]:
+            surface.blit(text_surface, text_rect)
         
         # Final score
         score_text = f"Final Score: {final_score:,}"
@@ -138,15 +276,12 @@ class GameUI:
         
         # High score
         if final_score > high_score:
-            high_score_text = "NEW HIGH SCORE!"
-            high_score_color = YELLOW
+            surface.blit(*self.new_high_score_text)
         else:
             high_score_text = f"High Score: {high_score:,}"
-            high_score_color = WHITE
-            
-        high_score_surface = self.pygame_font_medium.render(high_score_text, True, high_score_color)
-        high_score_rect = high_score_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-        surface.blit(high_score_surface, high_score_rect)
+            high_score_surface = self.pygame_font_medium.render(high_score_text, True, WHITE)
+            high_score_rect = high_score_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
+            surface.blit(high_score_surface, high_score_rect)
         
         # Coins collected
         coins_text = f"Coins Collected: {coins}"
@@ -155,73 +290,29 @@ class GameUI:
         surface.blit(coins_surface, coins_rect)
         
         # Instructions
-        restart_text = "Press 'S' to Restart"
-        restart_surface = self.pygame_font_medium.render(restart_text, True, GREEN)
-        restart_rect = restart_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 80))
-        surface.blit(restart_surface, restart_rect)
-        
-        quit_text = "Press 'Q' to Quit"
-        quit_surface = self.pygame_font_medium.render(quit_text, True, WHITE)
-        quit_rect = quit_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 120))
-        surface.blit(quit_surface, quit_rect)
+        for text_surface, text_rect in self.game_over_texts[2:]:
+            surface.blit(text_surface, text_rect)
         
         return surface
     
     def draw_start_screen(self, surface):
         """Draw game start/menu screen"""
         # Background gradient effect
-        for y in range(WINDOW_HEIGHT):
-            color_intensity = int(50 + (y / WINDOW_HEIGHT) * 100)
-            pygame.draw.line(surface, (0, 0, color_intensity), (0, y), (WINDOW_WIDTH, y))
-        
-        # Title
-        title_text = "TEMPLE RUN CV"
-        title_surface = self.pygame_font_large.render(title_text, True, YELLOW)
-        title_rect = title_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))
-        surface.blit(title_surface, title_rect)
-        
-        # Subtitle
-        subtitle_text = "Enhanced Edition"
-        subtitle_surface = self.pygame_font_medium.render(subtitle_text, True, WHITE)
-        subtitle_rect = subtitle_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 60))
-        surface.blit(subtitle_surface, subtitle_rect)
+        pygame.surfarray.blit_array(surface, self.start_gradient)
         
-        # Instructions
-        instructions = [
-            "Press SPACE to Jump",
-            "Collect Coins for Points",
-            "Avoid Obstacles",
-            "",
-            "Press SPACE to Start"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            if instruction:  # Skip empty strings
-                color = GREEN if "Start" in instruction else WHITE
-                inst_surface = self.pygame_font_small.render(instruction, True, color)
-                inst_rect = inst_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + i * 30))
-                surface.blit(inst_surface, inst_rect)
+        # Title, subtitle and instructions
+        for text_surface, text_rect in self.start_texts:
+            surface.blit(text_surface, text_rect)
         
         return surface
     
     def draw_pause_screen(self, surface):
         """Draw pause screen overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        surface.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = "PAUSED"
-        pause_surface = self.pygame_font_large.render(pause_text, True, WHITE)
-        pause_rect = pause_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-        surface.blit(pause_surface, pause_rect)
-        
-        # Resume instruction
-        resume_text = "Press 'P' to Resume"
-        resume_surface = self.pygame_font_medium.render(resume_text, True, WHITE)
-        resume_rect = resume_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 50))
-        surface.blit(resume_surface, resume_rect)
+        surface.blit(self.pause_overlay, (0, 0))
+        
+        # Pause text and resume instruction
+        for text_surface, text_rect in self.pause_texts:
+            surface.blit(text_surface, text_rect)
         
         return surface
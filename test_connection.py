@@ -6,7 +6,9 @@ Test connection to phone camera via IP Webcam
 import requests
 import sys
 
-def test_connection():
+# Only meaningful with the phone on the network, so it is kept out of pytest collection
+def check_connection():
+    """Try to open the phone's video stream and report whether it answered"""
     ip_webcam_url = "http://100.102.121.116:8080"
     video_url = ip_webcam_url + "/video"
     
@@ -37,7 +39,7 @@ def test_connection():
 if __name__ == "__main__":
     print("📱 Phone Camera Connection Test")
     print("=" * 40)
-    success = test_connection()
+    success = check_connection()
     
     if success:
         print("\n🎉 Ready to use phone camera with Temple Run!")
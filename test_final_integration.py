@@ -3,129 +3,70 @@ Final Integration Test for Enhanced Temple Run with Gesture Control
 Tests all major systems: sound, background, gesture control, and game mechanics
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Game modules are imported once here rather than inside every test function
+from config.game_config import (WINDOW_WIDTH, WINDOW_HEIGHT, FPS, 
+                              ENABLE_GESTURE_CONTROL, ENABLE_SOUND_EFFECTS)
+from modules.gesture_control import HandGestureController, MEDIAPIPE_AVAILABLE
+from modules.background_simple import ParallaxBackground
+from utils.game_utils import sound_manager as global_sound_manager
+
+import main_enhanced
 
 def test_imports():
     """Test all required imports"""
     print("🧪 Testing imports...")
     
-    try:
-        import cv2
-        print("  ✓ OpenCV imported successfully")
-    except ImportError as e:
-        print(f"  ❌ OpenCV import failed: {e}")
-        return False
-    
-    try:
-        import pygame
-        print("  ✓ Pygame imported successfully")
-    except ImportError as e:
-        print(f"  ❌ Pygame import failed: {e}")
-        return False
-    
-    try:
-        import numpy as np
-        print("  ✓ NumPy imported successfully")
-    except ImportError as e:
-        print(f"  ❌ NumPy import failed: {e}")
-        return False
-    
-    try:
-        from modules.gesture_control import HandGestureController, MEDIAPIPE_AVAILABLE
-        print(f"  ✓ Gesture control imported (MediaPipe available: {MEDIAPIPE_AVAILABLE})")
-    except ImportError as e:
-        print(f"  ❌ Gesture control import failed: {e}")
-        return False
-    
-    try:
-        from modules.background_simple import ParallaxBackground
-        print("  ✓ Background system imported successfully")
-    except ImportError as e:
-        print(f"  ❌ Background system import failed: {e}")
-        return False
-    
-    try:
-        from utils.game_utils import sound_manager
-        print("  ✓ Sound system imported successfully")
-    except ImportError as e:
-        print(f"  ❌ Sound system import failed: {e}")
-        return False
+    # The game only picks MediaPipe control when the gesture module found MediaPipe
+    assert (main_enhanced.GESTURE_CONTROLLER_TYPE == "mediapipe") == MEDIAPIPE_AVAILABLE
+    print(f"  ✓ Gesture control imported (MediaPipe available: {MEDIAPIPE_AVAILABLE})")
     
-    return True
+    # Unknown sounds have no id and play as a no-op
+    assert global_sound_manager.sound_id("no_such_sound") is None
+    assert global_sound_manager.play_sound("no_such_sound") is None
+    print("  ✓ Sound system imported successfully")
 
 def test_configurations():
     """Test game configurations"""
     print("\n⚙️  Testing configurations...")
     
-    try:
-        from config.game_config import (WINDOW_WIDTH, WINDOW_HEIGHT, FPS, 
-                                      ENABLE_GESTURE_CONTROL, ENABLE_SOUND_EFFECTS)
-        print("  ✓ Game config loaded")
-        print(f"    - Window: {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
-        print(f"    - FPS: {FPS}")
-        print(f"    - Gesture control enabled: {ENABLE_GESTURE_CONTROL}")
-        print(f"    - Sound effects enabled: {ENABLE_SOUND_EFFECTS}")
-        return True
-    except Exception as e:
-        print(f"  ❌ Config test failed: {e}")
-        return False
+    assert WINDOW_WIDTH > 0 and WINDOW_HEIGHT > 0
+    print("  ✓ Game config loaded")
+    print(f"    - Window: {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+    print(f"    - FPS: {FPS}")
+    print(f"    - Gesture control enabled: {ENABLE_GESTURE_CONTROL}")
+    print(f"    - Sound effects enabled: {ENABLE_SOUND_EFFECTS}")
 
-def test_systems():
+def test_systems(sound_manager, gesture_controller, parallax_background):
     """Test individual systems"""
     print("\n🔧 Testing individual systems...")
     
     # Test sound system
-    try:
-        from utils.game_utils import sound_manager
-        print("  ✓ Sound manager initialized")
-        print(f"    - Sound muted: {sound_manager.sound_muted}")
-        print(f"    - Music muted: {sound_manager.music_muted}")
-    except Exception as e:
-        print(f"  ❌ Sound system test failed: {e}")
-        return False
+    print("  ✓ Sound manager initialized")
+    print(f"    - Sound muted: {sound_manager.sound_muted}")
+    print(f"    - Music muted: {sound_manager.music_muted}")
     
     # Test gesture control system
-    try:
-        from modules.gesture_control import HandGestureController, MEDIAPIPE_AVAILABLE
-        controller = HandGestureController()
-        
-        if MEDIAPIPE_AVAILABLE:
-            print("  ✓ Gesture controller created (MediaPipe available)")
-            print("    - Camera initialization can be tested")
-        else:
-            print("  ✓ Gesture controller created (MediaPipe fallback mode)")
-            print("    - Keyboard controls will be used")
-    except Exception as e:
-        print(f"  ❌ Gesture control test failed: {e}")
-        return False
+    assert gesture_controller is not None
+    if MEDIAPIPE_AVAILABLE:
+        print("  ✓ Gesture controller created (MediaPipe available)")
+        print("    - Camera initialization can be tested")
+    else:
+        print("  ✓ Gesture controller created (MediaPipe fallback mode)")
+        print("    - Keyboard controls will be used")
     
     # Test background system
-    try:
-        from modules.background_simple import ParallaxBackground
-        bg = ParallaxBackground()
-        print("  ✓ Background system initialized")
-        print(f"    - Layers: {len(bg.layers) if hasattr(bg, 'layers') else 'unknown'}")
-    except Exception as e:
-        print(f"  ❌ Background system test failed: {e}")
-        return False
-    
-    return True
+    assert parallax_background.layers
+    print("  ✓ Background system initialized")
+    print(f"    - Layers: {len(parallax_background.layers)}")
 
 def test_main_game_import():
     """Test main game import"""
     print("\n🎮 Testing main game import...")
     
-    try:
-        # Just test import, don't run the game
-        import main_enhanced
-        print("  ✓ Main game imported successfully")
-        print("  ✓ All systems integrated properly")
-        return True
-    except Exception as e:
-        print(f"  ❌ Main game import failed: {e}")
-        return False
+    # Imported at module level; just check it, don't run the game
+    assert hasattr(main_enhanced, "TempleRunGame")
+    print("  ✓ Main game imported successfully")
+    print("  ✓ All systems integrated properly")
 
 def main():
     """Run all tests"""
@@ -135,22 +76,19 @@ def main():
     
     all_passed = True
     
-    # Get MediaPipe availability
-    try:
-        from modules.gesture_control import MEDIAPIPE_AVAILABLE
-    except ImportError:
-        MEDIAPIPE_AVAILABLE = False
-    
-    # Run all tests
+    # Run all tests (the shared systems are built once, as the pytest fixtures do)
     tests = [
-        test_imports,
-        test_configurations,
-        test_systems,
-        test_main_game_import
+        (test_imports, ()),
+        (test_configurations, ()),
+        (test_systems, (global_sound_manager, HandGestureController(), ParallaxBackground())),
+        (test_main_game_import, ())
     ]
     
-    for test in tests:
-        if not test():
+    for test, args in tests:
+        try:
+            test(*args)
+        except Exception as e:
+            print(f"  ❌ {test.__name__} failed: {e}")
             all_passed = False
     
     print("\n" + "=" * 60)
@@ -3,10 +3,6 @@ Test Gesture Control Integration
 Quick test script to verify gesture control system works with the game
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from modules.gesture_control import HandGestureController
 import cv2
 import time
@@ -2,85 +2,87 @@
 Test OpenCV Gesture Control with Phone Camera
 """
 
-import sys
+import cv2
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
-def test_opencv_gesture_control():
-    """Test OpenCV gesture control system"""
-    print("🧪 Testing OpenCV Gesture Control...")
+from modules.opencv_gesture_control import OpenCVGestureController
+
+def run_gesture_test(controller, test_duration=30, show=True):
+    """Run live gesture recognition on an initialized controller for up to test_duration seconds"""
+    # Keep only the newest frame queued and take MJPEG streams as-is
+    controller.set_buffer_size(1)
+    controller.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
     
-    try:
-        from modules.opencv_gesture_control import OpenCVGestureController
-        
-        # Create controller
-        controller = OpenCVGestureController()
-        print("✓ Controller created")
-        
-        # Get IP Webcam URL from user
-        print("\n📱 IP Webcam Setup:")
-        print("1. Install 'IP Webcam' app on your phone")
-        print("2. Start the app and note the IP address shown")
-        print("3. The URL format is: http://IP_ADDRESS:8080")
-        print("   Example: http://192.168.1.100:8080")
-        print("4. Or use 0 for default camera")
-        
-        camera_source = input("\nEnter IP Webcam URL or '0' for default camera: ").strip()
+    print("\n🤲 Testing gesture recognition...")
+    if show:
+        print("⚠ Press 'q' to quit the test")
+        print("📹 Camera window will show gesture detection")
+    
+    # Test gesture detection for test_duration seconds or until 'q' is pressed
+    
+    # Run a few frames first so one-time codec and buffer setup stays out of the timing
+    for _ in range(3):
+        controller.process_frame()
+    
+    # Budget the loop in OpenCV ticks, converting the duration once up front
+    start_ticks = cv2.getTickCount()
+    deadline_ticks = int(test_duration * cv2.getTickFrequency())
+    frame_count = 0
+    
+    while cv2.getTickCount() - start_ticks < deadline_ticks:
+        frame, gesture, confidence = controller.process_frame()
+        assert frame is not None, "No frame received"
+        frame_count += 1
         
-        if camera_source == '0':
-            camera_source = 0
+        # Check for gesture actions
+        action = controller.get_gesture_action()
+        if action:
+            print(f"🎯 Gesture Action: {action} (confidence: {confidence:.2f})")
         
-        # Test camera initialization
-        if controller.initialize_camera(camera_source):
-            print("✓ Camera initialized successfully")
+        if show:
+            # Show the frame
+            cv2.imshow("OpenCV Gesture Test", frame)
             
-            print("\n🤲 Testing gesture recognition...")
-            print("⚠ Press 'q' to quit the test")
-            print("📹 Camera window will show gesture detection")
-            
-            # Test gesture detection for 30 seconds or until 'q' is pressed
-            import cv2
-            import time
-            
-            start_time = time.time()
-            test_duration = 30  # seconds
-            
-            while time.time() - start_time < test_duration:
-                frame, gesture, confidence = controller.process_frame()
-                
-                if frame is not None:
-                    # Show the frame
-                    cv2.imshow("OpenCV Gesture Test", frame)
-                    
-                    # Check for gesture actions
-                    action = controller.get_gesture_action()
-                    if action:
-                        print(f"🎯 Gesture Action: {action} (confidence: {confidence:.2f})")
-                    
-                    # Check for quit
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == ord('q'):
-                        print("⚠ Test stopped by user")
-                        break
-                else:
-                    print("⚠ No frame received")
-                    break
-            
-            print("✓ Gesture detection test completed")
-            
-        else:
-            print("❌ Camera initialization failed")
-            return False
-        
-        # Cleanup
-        controller.cleanup()
-        print("✓ Controller cleaned up")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
+            # Check for quit
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                print("⚠ Test stopped by user")
+                break
+    
+    elapsed = (cv2.getTickCount() - start_ticks) / cv2.getTickFrequency()
+    print(f"✓ Gesture detection test completed ({frame_count / elapsed:.1f} FPS)")
+
+@pytest.mark.camera
+def test_opencv_gesture_control(opencv_controller):
+    """Test OpenCV gesture control on TEMPLE_RUN_CAMERA (default camera 0); needs --run-camera"""
+    camera_source = os.getenv('TEMPLE_RUN_CAMERA', '0')
+    if camera_source == '0':
+        camera_source = 0
+    
+    # Camera-only OpenCV/FFmpeg setup, imported here so the rest of the suite keeps the defaults
+    import utils.testing  # noqa: F401
+    
+    if not opencv_controller.initialize_camera(camera_source):
+        pytest.skip(f"camera {camera_source!r} could not be opened")
+    
+    # No window under pytest: the pinned opencv-python-headless build has no imshow
+    run_gesture_test(opencv_controller, test_duration=5, show=False)
+
+def prompt_camera_source():
+    """Ask the user for an IP Webcam URL or the default camera"""
+    print("\n📱 IP Webcam Setup:")
+    print("1. Install 'IP Webcam' app on your phone")
+    print("2. Start the app and note the IP address shown")
+    print("3. The URL format is: http://IP_ADDRESS:8080")
+    print("   Example: http://192.168.1.100:8080")
+    print("4. Or use 0 for default camera")
+    
+    camera_source = input("\nEnter IP Webcam URL or '0' for default camera: ").strip()
+    
+    if camera_source == '0':
+        camera_source = 0
+    return camera_source
 
 def main():
     """Run the test"""
@@ -88,7 +90,27 @@ def main():
     print("🚀 OPENCV GESTURE CONTROL TEST")
     print("=" * 60)
     
-    if test_opencv_gesture_control():
+    print("🧪 Testing OpenCV Gesture Control...")
+    controller = OpenCVGestureController()
+    print("✓ Controller created")
+    
+    try:
+        # Test camera initialization
+        import utils.testing  # noqa: F401  (FFmpeg options and OpenCV threading for the capture)
+        if not controller.initialize_camera(prompt_camera_source()):
+            raise RuntimeError("Camera initialization failed")
+        print("✓ Camera initialized successfully")
+        
+        run_gesture_test(controller)
+        passed = True
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        passed = False
+    finally:
+        controller.cleanup()
+        print("✓ Controller cleaned up")
+    
+    if passed:
         print("\n🎉 OpenCV gesture control test passed!")
         print("✅ Ready to use with Temple Run game")
         print("\n📱 To use with the game:")
@@ -4,102 +4,123 @@ Quick test script to verify OpenCV gesture control setup
 Tests the module without requiring an actual camera connection
 """
 
-import sys
-import os
+import argparse
+import importlib.metadata
+import importlib.util
 
-# Add the project directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import cv2
+import numpy as np
 
-def test_opencv_imports():
+from modules.opencv_gesture_control import OpenCVGestureController, GestureType
+from modules.keyboard_gesture_control import KeyboardGestureController
+from utils.bytecode import precompile
+
+# Optional packages are only located, not imported; importing mediapipe alone
+# takes longer than the rest of this check
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
+MEDIAPIPE_AVAILABLE = importlib.util.find_spec("mediapipe") is not None
+
+def test_opencv_imports(opencv_controller):
     """Test if all required modules can be imported"""
     print("🧪 Testing OpenCV Gesture Control Setup...")
     print("=" * 50)
     
-    try:
-        print("📦 Testing imports...")
-        
-        # Test OpenCV
-        import cv2
-        print(f"✅ OpenCV: {cv2.__version__}")
-        
-        # Test requests
-        import requests
-        print(f"✅ Requests: {requests.__version__}")
-        
-        # Test numpy
-        import numpy as np
-        print(f"✅ NumPy: {np.__version__}")
-        
-        # Test our gesture control module
-        from modules.opencv_gesture_control import OpenCVGestureController
-        print("✅ OpenCV Gesture Controller: Module imported successfully")
-        
-        # Test controller creation
-        controller = OpenCVGestureController()
-        print("✅ Controller Creation: Successfully created controller instance")
-        
-        # Test enum
-        from modules.opencv_gesture_control import GestureType
-        print(f"✅ Gesture Types: {[g.value for g in GestureType]}")
-        
-        print("\n🎉 All imports successful!")
-        print("📱 You can now use phone camera gesture control")
-        print("💡 Run 'python main_enhanced.py' to start the game")
-        print("📖 See PHONE_CAMERA_SETUP.md for phone setup instructions")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import Error: {e}")
-        print("💡 Try running: pip install -r requirements.txt")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected Error: {e}")
-        return False
+    print("📦 Testing imports...")
+    
+    # Test OpenCV
+    print(f"✅ OpenCV: {cv2.__version__}")
+    
+    # Test requests
+    if REQUESTS_AVAILABLE:
+        print(f"✅ Requests: {importlib.metadata.version('requests')}")
+    else:
+        print("⚠️  Requests: Not installed")
+    
+    # Test numpy
+    print(f"✅ NumPy: {np.__version__}")
+    
+    # Test our gesture control module
+    print("✅ OpenCV Gesture Controller: Module imported successfully")
+    
+    # Test controller creation: no camera yet, so nothing is read or recognized
+    assert not opencv_controller.is_active()
+    assert opencv_controller.process_frame() == (None, GestureType.IDLE, 0.0)
+    print("✅ Controller Creation: Successfully created controller instance")
+    
+    # Test recognition on a blank frame: no skin, so no hand and no action
+    blank = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame, gesture, confidence = opencv_controller.process_frame_small(blank)
+    assert frame.shape == blank.shape
+    assert (gesture, confidence) == (GestureType.IDLE, 0.0)
+    assert opencv_controller.get_gesture_action() is None
+    print("✅ Blank Frame: Recognized as idle with no action")
+    
+    # Test enum
+    assert [g.value for g in GestureType] == ["idle", "jump", "crouch"]
+    print(f"✅ Gesture Types: {[g.value for g in GestureType]}")
 
 def test_fallback_system():
     """Test the gesture control fallback system"""
     print("\n🔄 Testing Fallback System...")
     print("=" * 30)
     
+    # Test MediaPipe import
+    if MEDIAPIPE_AVAILABLE:
+        print("✅ MediaPipe: Available")
+    else:
+        print("⚠️  MediaPipe: Not available (will use OpenCV)")
+    
+    # Test OpenCV fallback: stays inactive until a camera is connected
+    opencv_fallback = OpenCVGestureController()
+    assert not opencv_fallback.is_active()
+    opencv_fallback.cleanup()
+    print("✅ OpenCV Fallback: Available")
+    
+    # Test keyboard fallback: always active, and a simulated fist is a jump
+    keyboard_fallback = KeyboardGestureController()
+    assert keyboard_fallback.is_active()
+    assert keyboard_fallback.set_gesture_from_key('F')
+    assert keyboard_fallback.get_gesture_action() == "jump"
+    keyboard_fallback.cleanup()
+    print("✅ Keyboard Fallback: Available")
+    
+    # Determine which system will be used
+    if MEDIAPIPE_AVAILABLE:
+        print("🎯 Primary System: MediaPipe gesture control")
+    else:
+        print("🎯 Primary System: OpenCV gesture control (phone camera)")
+
+def run_check(test, *args):
+    """Run one check outside pytest and report whether it passed"""
     try:
-        # Test MediaPipe import
-        try:
-            import mediapipe as mp
-            print("✅ MediaPipe: Available")
-            mediapipe_available = True
-        except ImportError:
-            print("⚠️  MediaPipe: Not available (will use OpenCV)")
-            mediapipe_available = False
-        
-        # Test OpenCV fallback
-        from modules.opencv_gesture_control import OpenCVGestureController
-        print("✅ OpenCV Fallback: Available")
-        
-        # Test keyboard fallback
-        from modules.keyboard_gesture_control import KeyboardGestureController
-        print("✅ Keyboard Fallback: Available")
-        
-        # Determine which system will be used
-        if mediapipe_available:
-            print("🎯 Primary System: MediaPipe gesture control")
-        else:
-            print("🎯 Primary System: OpenCV gesture control (phone camera)")
-        
-        print("✅ Fallback system working correctly!")
+        test(*args)
         return True
-        
+    except ImportError as e:
+        print(f"❌ Import Error: {e}")
+        print("💡 Try running: pip install -r requirements.txt")
+        return False
     except Exception as e:
-        print(f"❌ Fallback test failed: {e}")
+        print(f"❌ Check failed: {e}")
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenCV gesture control setup check")
+    parser.add_argument("--warm", action="store_true",
+                        help="byte-compile modules/, utils/ and config/ first")
+    args = parser.parse_args()
+    
+    if args.warm:
+        precompile()
+        print("✅ Bytecode cache warmed")
+    
     print("🔧 Temple Run - OpenCV Gesture Control Test")
     print("=" * 50)
     
     # Run tests
-    imports_ok = test_opencv_imports()
-    fallback_ok = test_fallback_system()
+    controller = OpenCVGestureController()
+    imports_ok = run_check(test_opencv_imports, controller)
+    controller.cleanup()
+    fallback_ok = run_check(test_fallback_system)
     
     if imports_ok and fallback_ok:
         print("\n🎉 SUCCESS: All systems ready!")
@@ -0,0 +1,83 @@
+"""
+Check that the Numba and orjson fast paths match the plain Python/NumPy fallbacks
+Each test is skipped when its optional package is not installed
+"""
+
+import numpy as np
+import pytest
+
+from config.game_config import *
+import utils.game_utils as game_utils
+from utils.game_utils import (cached_gradient_background, clamp, create_particle_effect, ease_in_out,
+                              lerp3, load_high_score, save_high_score)
+from utils.numba_compat import NUMBA_AVAILABLE
+from modules.player import physics_step
+
+requires_numba = pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+
+@requires_numba
+def test_physics_step_compiled():
+    """Compiled physics_step agrees with its Python source over a jump and landing"""
+    for state in [(float(PLAYER_START_Y), float(JUMP_SPEED), True, False),
+                  (PLAYER_START_Y - 50.0, 3.0, False, False),
+                  (PLAYER_START_Y - 1.0, float(MAX_FALL_SPEED), False, True),
+                  (float(PLAYER_START_Y), 0.0, False, False)]:
+        state += (float(GRAVITY), float(MAX_FALL_SPEED), float(PLAYER_START_Y))
+        compiled = physics_step(*state)
+        python = physics_step.py_func(*state)
+        assert compiled[0] == pytest.approx(python[0])
+        assert compiled[1] == pytest.approx(python[1])
+        assert compiled[2:] == python[2:]
+
+@requires_numba
+def test_scalar_kernels_compiled():
+    """lerp3, ease_in_out and clamp return what their Python sources do"""
+    for ratio in np.linspace(0.0, 1.0, 11):
+        args = (255.0, 128.0, 0.0, 30.0, 60.0, 200.0, float(ratio))
+        assert lerp3(*args) == lerp3.py_func(*args)
+        assert ease_in_out(float(ratio)) == pytest.approx(ease_in_out.py_func(float(ratio)))
+    
+    assert clamp(15, 0, 10) == clamp.py_func(15, 0, 10) == 10
+    assert clamp(-0.5, 0.0, 1.0) == clamp.py_func(-0.5, 0.0, 1.0) == 0.0
+    assert clamp(0.5, 0, 1) == clamp.py_func(0.5, 0, 1) == 0.5
+    assert clamp(7, 0.0, 2.5) == clamp.py_func(7, 0.0, 2.5) == 2.5
+
+@requires_numba
+@pytest.mark.parametrize("direction", ["vertical", "horizontal"])
+def test_gradient_kernel_matches_numpy(monkeypatch, direction):
+    """gradient_kernel builds the same image as the NumPy gradient"""
+    args = (64, 48, (135, 206, 235), (34, 139, 34), direction)
+    cached_gradient_background.cache_clear()
+    compiled = cached_gradient_background(*args)
+    
+    monkeypatch.setattr(game_utils, "NUMBA_AVAILABLE", False)
+    cached_gradient_background.cache_clear()
+    fallback = cached_gradient_background(*args)
+    cached_gradient_background.cache_clear()
+    
+    np.testing.assert_array_equal(compiled, fallback)
+
+@requires_numba
+def test_stamp_disks_matches_numpy(monkeypatch):
+    """stamp_disks paints the same pixels as the PARTICLE_DISKS stamps, including at the edges"""
+    frames = []
+    for numba_enabled in (True, False):
+        monkeypatch.setattr(game_utils, "NUMBA_AVAILABLE", numba_enabled)
+        np.random.seed(7)
+        frame = np.zeros((40, 40, 3), dtype=np.uint8)
+        for center in [(20, 20), (2, 3), (38, 37)]:
+            create_particle_effect(frame, center, num_particles=25, color=ORANGE)
+        frames.append(frame)
+    
+    np.testing.assert_array_equal(frames[0], frames[1])
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_high_score_round_trip(monkeypatch, tmp_path, use_orjson):
+    """High scores written by one JSON backend read back the same"""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(game_utils, "ORJSON_AVAILABLE", use_orjson)
+    monkeypatch.chdir(tmp_path)
+    
+    save_high_score(1234, 56)
+    assert load_high_score() == (1234, 56)
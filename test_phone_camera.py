@@ -3,16 +3,96 @@
 Test script for OpenCV gesture control with phone camera via IP Webcam
 """
 
+import argparse
 import cv2
-import sys
-import os
+import numpy as np
+import requests
 
-# Add the project directory to path so we can import modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from utils.testing import configure_stream, low_resolution_url, run_capture_loop
+from modules.opencv_gesture_control import OpenCVGestureController, LatestFrameReader
 
-from modules.opencv_gesture_control import OpenCVGestureController
+class MjpegFrameReader(LatestFrameReader):
+    """LatestFrameReader that parses the HTTP MJPEG stream itself instead of using VideoCapture"""
+    
+    def __init__(self, url, chunk_size=16384):
+        super().__init__(cap=None)
+        self.url = url
+        self.chunk_size = chunk_size
+        self.response = None
+        # Preallocated and reused for every frame; grows only if a frame doesn't fit
+        self.buffer = bytearray(128 * 1024)
+        self.buffer_end = 0
+    
+    def open(self):
+        """Connect to the stream; returns False if the server can't be reached"""
+        try:
+            self.response = requests.get(self.url, stream=True, timeout=3)
+            self.response.raise_for_status()
+            return True
+        except requests.RequestException as e:
+            print(f"❌ Could not open MJPEG stream: {e}")
+            return False
+    
+    def update(self):
+        """Capture loop: decode the newest complete JPEG in each received chunk"""
+        try:
+            for chunk in self.response.iter_content(chunk_size=self.chunk_size):
+                if self.stopped:
+                    break
+                self.append(chunk)
+                frame = self.decode_latest()
+                if frame is not None:
+                    with self.condition:
+                        self.frame = frame
+                        self.frame_id += 1
+                        self.condition.notify_all()
+        except Exception as e:
+            if not self.stopped:
+                print(f"⚠ MJPEG stream error: {e}")
+        finally:
+            with self.condition:
+                self.stopped = True
+                self.condition.notify_all()
+    
+    def append(self, chunk):
+        """Copy a chunk into the reusable buffer, growing it only when full"""
+        end = self.buffer_end + len(chunk)
+        if end > len(self.buffer):
+            self.buffer.extend(bytes(end - len(self.buffer)))
+        self.buffer[self.buffer_end:end] = chunk
+        self.buffer_end = end
+    
+    def decode_latest(self):
+        """Decode the last complete JPEG in the buffer and drop everything before its end"""
+        end = self.buffer.rfind(b'\xff\xd9', 0, self.buffer_end)
+        if end == -1:
+            return None
+        start = self.buffer.rfind(b'\xff\xd8', 0, end)
+        end += 2
+        
+        frame = None
+        if start != -1:
+            # Zero-copy view of the JPEG bytes; np.fromstring would copy them
+            jpeg = np.frombuffer(self.buffer, dtype=np.uint8, count=end - start, offset=start)
+            frame = cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+            del jpeg  # release the buffer export before shifting the data below
+        
+        # Move any partial next frame to the front of the buffer
+        leftover = self.buffer_end - end
+        self.buffer[:leftover] = self.buffer[end:self.buffer_end]
+        self.buffer_end = leftover
+        return frame
+    
+    def stop(self):
+        """Stop the capture thread and close the HTTP stream"""
+        self.stopped = True
+        if self.response is not None:
+            self.response.close()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
 
-def test_phone_camera():
+# Prompts for a URL and needs a live phone camera, so it is kept out of pytest collection
+def run_phone_camera_test(skip_frames=2, headless=False, duration=30, raw_mjpeg=False):
     """Test phone camera connection and gesture recognition"""
     print("📱 Testing phone camera gesture control...")
     print("="*50)
@@ -35,66 +115,40 @@ def test_phone_camera():
     
     print(f"\n🔄 Connecting to: {ip_webcam_url}")
     
-    # Try to initialize camera
-    if not controller.initialize_camera(ip_webcam_url):
-        print("❌ Failed to connect to phone camera")
-        print("💡 Make sure:")
-        print("   - IP Webcam app is running on your phone")
-        print("   - Phone and computer are on same WiFi network")
-        print("   - URL is correct (should include http://)")
-        return
+    if raw_mjpeg:
+        # Parse the MJPEG stream here instead of going through VideoCapture
+        reader = MjpegFrameReader(low_resolution_url(ip_webcam_url))
+        if not reader.open():
+            return
+    else:
+        # Try to initialize camera
+        if not controller.initialize_camera(low_resolution_url(ip_webcam_url)):
+            print("❌ Failed to connect to phone camera")
+            print("💡 Make sure:")
+            print("   - IP Webcam app is running on your phone")
+            print("   - Phone and computer are on same WiFi network")
+            print("   - URL is correct (should include http://)")
+            return
+        
+        configure_stream(controller)
+        reader = LatestFrameReader(controller.cap)
     
     print("✅ Successfully connected to phone camera!")
-    print("\n🤲 Gesture Recognition Test:")
-    print("- Make a FIST to trigger JUMP gesture")
-    print("- Show 1 FINGER to trigger CROUCH gesture") 
-    print("- Show OPEN HAND for IDLE gesture")
-    print("- Press 'q' to quit")
-    print("- Press 'd' to toggle debug display")
-    print("- Press 'ESC' to exit")
     
-    # Main test loop
-    frame_count = 0
-    try:
-        while True:
-            # Process frame
-            frame, gesture, confidence = controller.process_frame()
-            
-            if frame is None:
-                print("⚠ No frame received from camera")
-                break
-            
-            frame_count += 1
-            
-            # Get gesture action
-            action = controller.get_gesture_action()
-            if action:
-                print(f"🎯 Action detected: {action.upper()} (confidence: {confidence:.2f})")
-            
-            # Display frame
-            cv2.imshow("Phone Camera Gesture Test", frame)
-            
-            # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q') or key == 27:  # 'q' or ESC
-                break
-            elif key == ord('d'):
-                debug_status = controller.toggle_debug()
-                print(f"🔧 Debug display: {'ON' if debug_status else 'OFF'}")
-            
-            # Print status every 30 frames
-            if frame_count % 30 == 0:
-                print(f"📊 Frame {frame_count}: {gesture.value} ({confidence:.2f})")
-    
-    except KeyboardInterrupt:
-        print("\n⚠ Test interrupted by user")
-    except Exception as e:
-        print(f"❌ Error during test: {e}")
-    finally:
-        # Cleanup
-        controller.cleanup()
-        cv2.destroyAllWindows()
-        print("\n✅ Test completed!")
+    run_capture_loop(controller, reader, "Phone Camera Gesture Test", "phone_camera_snapshot.jpg",
+                     skip_frames=skip_frames, headless=headless, duration=duration)
 
 if __name__ == "__main__":
-    test_phone_camera()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skip-frames", type=int, default=2,
+                        help="run gesture recognition on every Nth frame (default: 2)")
+    parser.add_argument("--headless", action="store_true",
+                        help="skip the preview window and save one frame per second to disk")
+    parser.add_argument("--duration", type=float, default=30,
+                        help="seconds to run in headless mode (default: 30)")
+    parser.add_argument("--raw-mjpeg", action="store_true",
+                        help="read the HTTP MJPEG stream directly instead of through VideoCapture")
+    args = parser.parse_args()
+    
+    run_phone_camera_test(skip_frames=max(1, args.skip_frames), headless=args.headless,
+                          duration=args.duration, raw_mjpeg=args.raw_mjpeg)
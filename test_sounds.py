@@ -1,108 +1,169 @@
 """
 Sound Effects Tester for Temple Run Game
 Simple script to test sound loading and playback
+
+Run interactively, or non-interactively with a comma-separated command list:
+    python test_sounds.py --script "1,2,3,m,s,q"
 """
 
+import argparse
 import pygame
 import os
-import sys
-
-# Add the parent directory to the path to import game modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.game_config import *
 from utils.game_utils import SoundManager
 
-def test_sounds():
-    """Test all sound effects"""
+def setup_sound_manager():
+    """Initialize pygame and load all sound effects and music"""
     print("🎵 Testing Temple Run Sound System")
     print("=" * 40)
     
-    # Initialize pygame
+    # Initialize pygame (importing utils.game_utils already opened the mixer
+    # with the game's 22050 Hz, 512-sample settings)
     pygame.init()
     
     # Create sound manager
     sound_manager = SoundManager()
     
+    # List the sounds directory once instead of stat-ing each file separately
+    try:
+        entries = {entry.name: entry.path for entry in os.scandir(SOUNDS_DIR) if entry.is_file()}
+    except FileNotFoundError:
+        print(f"⚠ Warning: Sounds directory not found: {SOUNDS_DIR}")
+        entries = {}
+    
     # Test sound files
-    sound_files = {
-        'jump': os.path.join(SOUNDS_DIR, 'jump.wav'),
-        'coin': os.path.join(SOUNDS_DIR, 'coin.wav'),
-        'collision': os.path.join(SOUNDS_DIR, 'collision.wav'),
-        'game_over': os.path.join(SOUNDS_DIR, 'gameover.wav'),
-        'start': os.path.join(SOUNDS_DIR, 'start.wav')
-    }
+    sound_files = [
+        ('jump', 'jump.wav'),
+        ('coin', 'coin.wav'),
+        ('collision', 'collision.wav'),
+        ('game_over', 'gameover.wav'),
+        ('start', 'start.wav')
+    ]
     
     # Load sounds
     print("Loading sound effects...")
-    for name, filepath in sound_files.items():
-        sound_manager.load_sound(name, filepath)
+    for name, filename in sound_files:
+        if filename in entries:
+            sound_manager.load_sound(name, entries[filename])
+        else:
+            print(f"⚠ Warning: Sound file not found: {filename}")
     
     # Test background music
     print("\nTesting background music...")
-    music_file = os.path.join(SOUNDS_DIR, 'background_music.mp3')
-    if os.path.exists(music_file):
-        sound_manager.play_music(music_file, loop=0)  # Play once for testing
+    if 'background_music.mp3' in entries:
+        sound_manager.play_music(entries['background_music.mp3'], loop=0)  # Play once for testing
         print("✓ Background music loaded and playing")
     else:
         print("⚠ Background music file not found")
     
-    # Interactive testing
-    print("\n" + "=" * 40)
-    print("Interactive Sound Test")
-    print("=" * 40)
-    print("Commands:")
-    print("  1 - Play jump sound")
-    print("  2 - Play coin sound")
-    print("  3 - Play collision sound")
-    print("  4 - Play game over sound")
-    print("  5 - Play start sound")
-    print("  m - Toggle mute")
-    print("  s - Show sound status")
-    print("  q - Quit")
-    print("=" * 40)
+    return sound_manager
+
+def play(sound_manager, name, label):
+    """Play a sound effect and report it"""
+    sound_manager.play_sound(name)
+    print(f"🎵 Playing {label} sound")
+
+def toggle_mute(sound_manager):
+    """Toggle all audio and report the new state"""
+    muted = sound_manager.toggle_all_mute()
+    print(f"🔇 All audio {'muted' if muted else 'unmuted'}")
+
+def show_status(sound_manager):
+    """Print the sound system status"""
+    status = sound_manager.get_sound_status()
+    print("\n📊 Sound System Status:")
+    print(f"  Sound Effects Muted: {status['sound_muted']}")
+    print(f"  Music Muted: {status['music_muted']}")
+    print(f"  Music Playing: {status['music_playing']}")
+    print(f"  Current Music: {status['current_music']}")
+    print(f"  Loaded Sounds: {', '.join(status['loaded_sounds'])}")
+
+def build_handlers(sound_manager):
+    """Map each command to its action ('q' is handled by the caller)"""
+    return {
+        '1': lambda: play(sound_manager, 'jump', 'jump'),
+        '2': lambda: play(sound_manager, 'coin', 'coin'),
+        '3': lambda: play(sound_manager, 'collision', 'collision'),
+        '4': lambda: play(sound_manager, 'game_over', 'game over'),
+        '5': lambda: play(sound_manager, 'start', 'start'),
+        'm': lambda: toggle_mute(sound_manager),
+        's': lambda: show_status(sound_manager),
+    }
+
+def run_commands(handlers, commands):
+    """Dispatch commands until 'q' or the input runs out"""
+    for command in commands:
+        command = command.strip().lower()
+        if command == 'q':
+            break
+        
+        handler = handlers.get(command)
+        if handler is None:
+            print("❌ Invalid command")
+        else:
+            handler()
+
+def interactive_commands():
+    """Yield commands typed by the user"""
+    while True:
+        yield input("\nEnter command: ")
+
+def main(argv=None, quit_pygame=True):
+    """Test all sound effects, interactively or from a command script"""
+    parser = argparse.ArgumentParser(description="Temple Run sound tester")
+    parser.add_argument("--script", help="comma-separated commands to run without prompting, e.g. '1,2,m,s,q'")
+    args = parser.parse_args(argv)
+    
+    sound_manager = setup_sound_manager()
+    handlers = build_handlers(sound_manager)
     
     try:
-        while True:
-            command = input("\nEnter command: ").strip().lower()
+        if args.script is not None:
+            run_commands(handlers, args.script.split(','))
+        else:
+            # Interactive testing
+            print("\n" + "=" * 40)
+            print("Interactive Sound Test")
+            print("=" * 40)
+            print("Commands:")
+            print("  1 - Play jump sound")
+            print("  2 - Play coin sound")
+            print("  3 - Play collision sound")
+            print("  4 - Play game over sound")
+            print("  5 - Play start sound")
+            print("  m - Toggle mute")
+            print("  s - Show sound status")
+            print("  q - Quit")
+            print("=" * 40)
             
-            if command == '1':
-                sound_manager.play_sound('jump')
-                print("🎵 Playing jump sound")
-            elif command == '2':
-                sound_manager.play_sound('coin')
-                print("🎵 Playing coin sound")
-            elif command == '3':
-                sound_manager.play_sound('collision')
-                print("🎵 Playing collision sound")
-            elif command == '4':
-                sound_manager.play_sound('game_over')
-                print("🎵 Playing game over sound")
-            elif command == '5':
-                sound_manager.play_sound('start')
-                print("🎵 Playing start sound")
-            elif command == 'm':
-                muted = sound_manager.toggle_all_mute()
-                print(f"🔇 All audio {'muted' if muted else 'unmuted'}")
-            elif command == 's':
-                status = sound_manager.get_sound_status()
-                print("\n📊 Sound System Status:")
-                print(f"  Sound Effects Muted: {status['sound_muted']}")
-                print(f"  Music Muted: {status['music_muted']}")
-                print(f"  Music Playing: {status['music_playing']}")
-                print(f"  Current Music: {status['current_music']}")
-                print(f"  Loaded Sounds: {', '.join(status['loaded_sounds'])}")
-            elif command == 'q':
-                break
-            else:
-                print("❌ Invalid command")
+            run_commands(handlers, interactive_commands())
     
     except KeyboardInterrupt:
         print("\n\n👋 Exiting sound tester...")
     
     finally:
-        pygame.quit()
-        print("✓ Sound system cleaned up")
+        if quit_pygame:
+            pygame.quit()
+            print("✓ Sound system cleaned up")
+    
+    return sound_manager
+
+def test_sounds_script():
+    """Run every command once without prompting"""
+    # Leave pygame running: the session sound_manager fixture and cached fonts still use it
+    sound_manager = main(['--script', '1,2,3,4,5,m,s,q'], quit_pygame=False)
+    
+    assert set(sound_manager.sound_ids) == {'jump', 'coin', 'collision', 'game_over', 'start'}
+    assert sound_manager.sound_volume == SOUND_VOLUME
+    
+    # 'm' muted everything, music included
+    assert sound_manager.sound_muted and sound_manager.music_muted
+    assert sound_manager.music.get_volume() == 0.0
+    
+    # Unmuting restores the configured music volume (the mixer stores it in 1/128 steps)
+    assert sound_manager.toggle_all_mute() is False
+    assert abs(sound_manager.music.get_volume() - MUSIC_VOLUME) < 0.01
 
 if __name__ == "__main__":
-    test_sounds()
+    main()
@@ -0,0 +1,12 @@
+"""
+Bytecode cache warming for the test scripts (no import-time setup, unlike utils.testing)
+"""
+
+import compileall
+import os
+
+def precompile():
+    """Byte-compile the game packages so later runs and test workers load cached bytecode"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package in ('modules', 'utils', 'config'):
+        compileall.compile_dir(os.path.join(root, package), quiet=1)
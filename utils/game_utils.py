@@ -7,7 +7,16 @@ import numpy as np
 import pygame
 import json
 import os
+from functools import lru_cache
 from config.game_config import *
+from utils.numba_compat import njit, prange, NUMBA_AVAILABLE
+
+# orjson parses and serializes in C; fall back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 def init_pygame_mixer():
     """Initialize Pygame mixer for sound with better settings"""
@@ -18,38 +27,63 @@ def init_pygame_mixer():
 def load_high_score():
     """Load high score from file"""
     try:
-        if os.path.exists("high_score.json"):
-            with open("high_score.json", "r") as f:
-                data = json.load(f)
-                return data.get("high_score", 0), data.get("total_coins", 0)
-    except:
+        with open("high_score.json", "rb") as f:
+            data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
+        return data.get("high_score", 0), data.get("total_coins", 0)
+    except FileNotFoundError:
         pass
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"⚠ Warning: Could not read high score: {e}")
     return 0, 0
 
 def save_high_score(score, total_coins):
     """Save high score to file"""
+    data = {"high_score": score, "total_coins": total_coins}
     try:
-        data = {"high_score": score, "total_coins": total_coins}
-        with open("high_score.json", "w") as f:
-            json.dump(data, f)
-    except:
-        pass
+        with open("high_score.json", "wb") as f:
+            f.write(orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode())
+    except (OSError, TypeError) as e:
+        print(f"⚠ Warning: Could not save high score: {e}")
+
+def create_gradient_background(width, height, color1, color2, direction="vertical", copy=True):
+    """Create a gradient background (copy=False returns the shared read-only image)"""
+    background = cached_gradient_background(width, height, tuple(color1), tuple(color2), direction)
+    return background.copy() if copy else background
+
+@njit("uint8[:, :, ::1](int64, int64, UniTuple(int64, 3), UniTuple(int64, 3), boolean)",
+      cache=True, parallel=True)
+def gradient_kernel(width, height, color1, color2, vertical):
+    """Blend and write every gradient pixel in one fused pass, rows in parallel"""
+    background = np.empty((height, width, 3), dtype=np.uint8)
+    for y in prange(height):
+        for x in range(width):
+            ratio = y / height if vertical else x / width
+            for channel in range(3):
+                background[y, x, channel] = int(color1[channel] * (1 - ratio) + color2[channel] * ratio)
+    return background
 
-def create_gradient_background(width, height, color1, color2, direction="vertical"):
-    """Create a gradient background"""
-    background = np.zeros((height, width, 3), dtype=np.uint8)
+@lru_cache(maxsize=8)
+def cached_gradient_background(width, height, color1, color2, direction):
+    """Build a gradient background once per argument set; the result is read-only"""
+    if NUMBA_AVAILABLE:
+        background = gradient_kernel(width, height, tuple(int(c) for c in color1),
+                                     tuple(int(c) for c in color2), direction == "vertical")
+        background.setflags(write=False)
+        return background
     
+    color1 = np.array(color1, dtype=np.float64)
+    color2 = np.array(color2, dtype=np.float64)
+    
+    # One blend ratio per row (or column), broadcast across the other axis
     if direction == "vertical":
-        for y in range(height):
-            ratio = y / height
-            color = [int(c1 * (1 - ratio) + c2 * ratio) for c1, c2 in zip(color1, color2)]
-            background[y, :] = color
+        ratio = (np.arange(height, dtype=np.float64) / height).reshape(height, 1, 1)
     else:  # horizontal
-        for x in range(width):
-            ratio = x / width
-            color = [int(c1 * (1 - ratio) + c2 * ratio) for c1, c2 in zip(color1, color2)]
-            background[:, x] = color
+        ratio = (np.arange(width, dtype=np.float64) / width).reshape(1, width, 1)
+    
+    gradient = (color1 * (1 - ratio) + color2 * ratio).astype(np.uint8)
     
+    background = np.ascontiguousarray(np.broadcast_to(gradient, (height, width, 3)))
+    background.setflags(write=False)
     return background
 
 def apply_screen_shake(image, intensity):
@@ -60,11 +94,11 @@ def apply_screen_shake(image, intensity):
     shake_x = np.random.randint(-intensity, intensity)
     shake_y = np.random.randint(-intensity, intensity)
     
-    # Create transformation matrix
-    M = np.float32([[1, 0, shake_x], [0, 1, shake_y]])
-    
-    # Apply transformation
-    shaken = cv2.warpAffine(image, M, (image.shape[1], image.shape[0]))
+    # Integer shift: copy the overlapping region onto black instead of resampling
+    height, width = image.shape[:2]
+    shaken = np.zeros_like(image)
+    shaken[max(0, shake_y):height + min(0, shake_y), max(0, shake_x):width + min(0, shake_x)] = \
+        image[max(0, -shake_y):height - max(0, shake_y), max(0, -shake_x):width - max(0, shake_x)]
     
     return shaken
 
@@ -73,56 +107,115 @@ def add_motion_blur(image, intensity=5):
     if intensity <= 0:
         return image
     
-    # Create motion blur kernel
-    kernel = np.zeros((intensity, intensity))
-    kernel[intensity//2, :] = np.ones(intensity)
-    kernel = kernel / intensity
-    
-    # Apply blur
-    blurred = cv2.filter2D(image, -1, kernel)
+    # A horizontal line kernel is just a 1 x intensity box filter
+    blurred = cv2.blur(image, (intensity, 1))
     return blurred
 
+def disk_offsets(radius):
+    """(dy, dx) offsets of every pixel within radius of a disk's center"""
+    dy, dx = np.indices((2 * radius + 1, 2 * radius + 1)) - radius
+    inside = dx * dx + dy * dy <= radius * radius
+    return dy[inside], dx[inside]
+
+# Disk stamps for every particle size create_particle_effect can draw
+PARTICLE_DISKS = {radius: disk_offsets(radius) for radius in range(2, 6)}
+
+@njit(cache=True)
+def stamp_disks(frame, xs, ys, sizes, color):
+    """Fill a solid disk of radius sizes[i] at (xs[i], ys[i]) for every particle, clipped to the frame"""
+    height, width = frame.shape[0], frame.shape[1]
+    for i in range(xs.shape[0]):
+        cx, cy, r = xs[i], ys[i], sizes[i]
+        for y in range(max(cy - r, 0), min(cy + r + 1, height)):
+            dy = y - cy
+            for x in range(max(cx - r, 0), min(cx + r + 1, width)):
+                dx = x - cx
+                if dx * dx + dy * dy <= r * r:
+                    frame[y, x, 0] = color[0]
+                    frame[y, x, 1] = color[1]
+                    frame[y, x, 2] = color[2]
+
 def create_particle_effect(frame, center, num_particles=10, color=WHITE):
     """Create particle explosion effect"""
-    for _ in range(num_particles):
-        # Random position around center
-        offset_x = np.random.randint(-20, 20)
-        offset_y = np.random.randint(-20, 20)
-        particle_pos = (center[0] + offset_x, center[1] + offset_y)
-        
-        # Random size
-        size = np.random.randint(2, 6)
-        
-        # Draw particle
-        cv2.circle(frame, particle_pos, size, color, -1)
+    # Sample every particle's offset and size in two calls instead of three per particle
+    offsets = np.random.randint(-20, 20, size=(num_particles, 2))
+    sizes = np.random.randint(2, 6, size=num_particles)
+    xs = offsets[:, 0] + center[0]
+    ys = offsets[:, 1] + center[1]
+    
+    if NUMBA_AVAILABLE:
+        # Rasterize all particles in one compiled pass
+        stamp_disks(frame, xs, ys, sizes, np.array(color, dtype=frame.dtype))
+    else:
+        # Paint all particles of each size at once with that size's disk stamp
+        height, width = frame.shape[:2]
+        for size in np.unique(sizes).tolist():
+            selected = sizes == size
+            dy, dx = PARTICLE_DISKS[size]
+            pixel_ys = ys[selected][:, None] + dy
+            pixel_xs = xs[selected][:, None] + dx
+            inside = (pixel_ys >= 0) & (pixel_ys < height) & (pixel_xs >= 0) & (pixel_xs < width)
+            frame[pixel_ys[inside], pixel_xs[inside]] = color
     
     return frame
 
-def interpolate_color(color1, color2, ratio):
-    """Interpolate between two colors"""
+@njit("UniTuple(int64, 3)(float64, float64, float64, float64, float64, float64, float64)", cache=True)
+def lerp3(r1, g1, b1, r2, g2, b2, ratio):
+    """Blend two 3-channel colors, truncating each channel to an int"""
+    return (int(r1 * (1 - ratio) + r2 * ratio),
+            int(g1 * (1 - ratio) + g2 * ratio),
+            int(b1 * (1 - ratio) + b2 * ratio))
+
+@lru_cache(maxsize=64)
+def color_lut(color1, color2):
+    """Blends from color1 to color2 at ratios 0, 1/255, ..., 1, as tuples of ints"""
+    # Same float64 blend and truncation as lerp3, so each entry is the exact blend at its ratio
+    ratio = (np.arange(256, dtype=np.float64) / 255)[:, None]
+    blends = np.array(color1, dtype=np.float64) * (1 - ratio) + np.array(color2, dtype=np.float64) * ratio
+    return tuple(map(tuple, blends.astype(np.int64).tolist()))
+
+def interpolate_color(color1, color2, ratio, quantize=True):
+    """Interpolate between two colors (by default the ratio is rounded down to 1/255 steps and looked up)"""
+    if quantize:
+        index = min(max(int(ratio * 255), 0), 255)
+        return color_lut(tuple(color1), tuple(color2))[index]
+    if len(color1) == 3 and len(color2) == 3:
+        return lerp3(*color1, *color2, ratio)
+    # lerp3 is RGB only; blend other channel counts (e.g. RGBA) channel by channel
     return tuple(int(c1 * (1 - ratio) + c2 * ratio) for c1, c2 in zip(color1, color2))
 
+@lru_cache(maxsize=16)
+def get_font(size):
+    """Default pygame font at the given size, created once per size"""
+    return pygame.font.Font(None, size)
+
 def create_glowing_text(text, font_size=36, glow_color=(255, 255, 0), text_color=(255, 255, 255)):
     """Create glowing text effect using pygame"""
-    font = pygame.font.Font(None, font_size)
+    font = get_font(font_size)
     
     # Create text surface
     text_surface = font.render(text, True, text_color)
     
-    # Create glow effect (multiple renders with offset)
-    glow_surface = pygame.Surface((text_surface.get_width() + 20, text_surface.get_height() + 20))
-    glow_surface.fill((0, 0, 0))
-    glow_surface.set_colorkey((0, 0, 0))
+    # Render the glow once and grow its coverage by 2px in every direction,
+    # matching the old 5x5 grid of offset renders in a single dilation
+    glow_text = font.render(text, True, glow_color)
+    width, height = text_surface.get_size()
+    coverage = np.zeros((width + 20, height + 20), dtype=np.uint8)
+    coverage[10:10 + width, 10:10 + height] = pygame.surfarray.array_alpha(glow_text)
+    coverage = cv2.dilate(coverage, np.ones((5, 5), np.uint8))
     
-    # Render glow
-    for dx in range(-2, 3):
-        for dy in range(-2, 3):
-            if dx != 0 or dy != 0:
-                glow_text = font.render(text, True, glow_color)
-                glow_surface.blit(glow_text, (10 + dx, 10 + dy))
+    # Glow color blended over black by coverage, as blitting onto the black fill did
+    glow = coverage[:, :, None].astype(np.uint16) * np.array(glow_color, dtype=np.uint16) // 255
     
-    # Render main text on top
-    glow_surface.blit(text_surface, (10, 10))
+    # Composite the main text on top by its alpha in numpy rather than with a blit
+    text_alpha = pygame.surfarray.array_alpha(text_surface)[:, :, None].astype(np.uint16)
+    text_region = glow[10:10 + width, 10:10 + height]
+    text_region[:] = (np.array(text_color, dtype=np.uint16) * text_alpha
+                      + text_region * (255 - text_alpha)) // 255
+    
+    # Upload the finished image once
+    glow_surface = pygame.surfarray.make_surface(glow.astype(np.uint8))
+    glow_surface.set_colorkey((0, 0, 0))
     
     return glow_surface
 
@@ -134,38 +227,47 @@ def calculate_3d_position(x, z, camera_distance=500):
     
     return int(screen_x), scale
 
-def create_road_perspective(width, height, road_width=200):
-    """Create a perspective road effect"""
-    road = np.zeros((height, width, 3), dtype=np.uint8)
+def create_road_perspective(width, height, road_width=200, copy=True):
+    """Create a perspective road effect (copy=False returns the shared read-only image)"""
+    road = cached_road_perspective(width, height, road_width)
+    return road.copy() if copy else road
+
+@lru_cache(maxsize=8)
+def cached_road_perspective(width, height, road_width):
+    """Build a perspective road once per argument set; the result is read-only"""
+    road = np.empty((height, width, 3), dtype=np.uint8)
     
     # Fill background
     road[:] = GREEN
     
-    # Draw road with perspective
-    for y in range(height):
-        # Calculate road width at this Y position (perspective effect)
-        perspective_ratio = y / height
-        current_road_width = int(road_width * (0.3 + 0.7 * perspective_ratio))
-        
-        # Calculate road position (centered)
-        road_left = width // 2 - current_road_width // 2
-        road_right = width // 2 + current_road_width // 2
-        
-        # Draw road surface
-        road[y, road_left:road_right] = (139, 69, 19)  # Brown road
-        
-        # Draw road markings
-        if y % 40 < 20 and current_road_width > 20:  # Dashed lines
-            center_line_start = width // 2 - 2
-            center_line_end = width // 2 + 2
-            road[y, center_line_start:center_line_end] = WHITE
+    # Road width at each Y position (perspective effect), centered
+    rows = np.arange(height)
+    # rows / height first, as the per-row perspective ratio was, so truncation matches exactly
+    road_widths = (road_width * (0.3 + 0.7 * (rows / height))).astype(np.int32)
+    road_lefts = width // 2 - road_widths // 2
+    road_rights = width // 2 + road_widths // 2
     
+    # Draw road surface
+    columns = np.arange(width)
+    road_mask = (columns >= road_lefts[:, None]) & (columns < road_rights[:, None])
+    road[road_mask] = (139, 69, 19)  # Brown road
+    
+    # Draw road markings
+    dash_rows = (rows % 40 < 20) & (road_widths > 20)  # Dashed lines
+    road[dash_rows, width // 2 - 2:width // 2 + 2] = WHITE
+    
+    road.setflags(write=False)
     return road
 
+# The signature is given so this compiles at import rather than on first call
+@njit("float64(float64)", cache=True, fastmath=True)
 def ease_in_out(t):
     """Easing function for smooth animations"""
     return t * t * (3.0 - 2.0 * t)
 
+# Compiled lazily per argument types: fixed signatures would cast mixed int/float
+# calls such as clamp(0.5, 0, 1) to the int64 overload and truncate the value
+@njit(cache=True)
 def clamp(value, min_val, max_val):
     """Clamp a value between min and max"""
     return max(min_val, min(max_val, value))
@@ -174,11 +276,26 @@ class SoundManager:
     """Enhanced sound management with mute functionality and better error handling"""
     def __init__(self):
         self.sounds = {}
-        self.music_playing = False
         self.sound_muted = False
         self.music_muted = False
         self.current_music_file = None
-        self.sound_channels = {}
+        
+        # Sounds and their last channels by integer id, assigned at load time;
+        # hot callers can keep the id from load_sound()/sound_id() and skip the name lookup
+        self.sound_ids = {}
+        self.sound_list = []
+        self.channel_list = []
+        
+        # Master effects volume, and whether play_sound(volume=...) has since overridden any sound
+        self.sound_volume = SOUND_VOLUME
+        self.volume_overridden = False
+        
+        # Whether each sound/music path exists, checked once per path
+        self.path_exists = {}
+        
+        # Bound once so the music methods skip the module attribute chain
+        self.music = pygame.mixer.music
+        self.music_volume = MUSIC_VOLUME
         
         # Initialize pygame mixer if not already done
         self.init_mixer()
@@ -193,42 +310,71 @@ class SoundManager:
         except Exception as e:
             print(f"⚠ Warning: Could not initialize sound system: {e}")
         
+    def file_exists(self, filepath):
+        """os.path.exists, cached so repeat loads and plays skip the stat call"""
+        exists = self.path_exists.get(filepath)
+        if exists is None:
+            exists = self.path_exists[filepath] = os.path.exists(filepath)
+        return exists
+    
     def load_sound(self, name, filepath):
-        """Load a sound file with error handling"""
+        """Load a sound file with error handling; returns the sound's integer id"""
         try:
-            if os.path.exists(filepath):
+            if self.file_exists(filepath):
                 sound = pygame.mixer.Sound(filepath)
-                sound.set_volume(SOUND_VOLUME)
-                self.sounds[name] = sound
+                sound.set_volume(self.sound_volume)
                 print(f"✓ Loaded sound: {name}")
             else:
                 print(f"⚠ Warning: Sound file not found: {filepath}")
-                self.sounds[name] = None
+                sound = None
         except Exception as e:
             print(f"⚠ Warning: Could not load sound {name}: {e}")
-            self.sounds[name] = None
+            sound = None
+        
+        self.sounds[name] = sound
+        
+        # Reloading a name reuses its id
+        sound_id = self.sound_ids.get(name)
+        if sound_id is None:
+            sound_id = self.sound_ids[name] = len(self.sound_list)
+            self.sound_list.append(sound)
+            self.channel_list.append(None)
+        else:
+            self.sound_list[sound_id] = sound
+        return sound_id
+    
+    def sound_id(self, name):
+        """Integer id of a loaded sound, or None"""
+        return self.sound_ids.get(name)
     
     def play_sound(self, name, volume=None, prevent_overlap=False):
-        """Play a sound effect with advanced options"""
-        if self.sound_muted or name not in self.sounds or not self.sounds[name]:
+        """Play a sound effect (by name or integer id) with advanced options"""
+        if self.sound_muted:
+            return None
+        
+        sound_id = self.sound_ids.get(name) if isinstance(name, str) else name
+        if sound_id is None:
+            return None
+        sound = self.sound_list[sound_id]
+        if sound is None:
             return None
             
         try:
-            sound = self.sounds[name]
-            
             # Stop previous instance if preventing overlap
-            if prevent_overlap and name in self.sound_channels:
-                if self.sound_channels[name].get_busy():
-                    self.sound_channels[name].stop()
+            previous = self.channel_list[sound_id]
+            if prevent_overlap and previous is not None:
+                if previous.get_busy():
+                    previous.stop()
             
             # Set custom volume if provided
             if volume is not None:
                 sound.set_volume(volume)
+                self.volume_overridden = True
             
             # Play sound and store channel reference
             channel = sound.play()
             if channel:
-                self.sound_channels[name] = channel
+                self.channel_list[sound_id] = channel
             
             return channel
         except Exception as e:
@@ -241,16 +387,15 @@ class SoundManager:
             return
             
         try:
-            if os.path.exists(filepath):
-                pygame.mixer.music.load(filepath)
-                pygame.mixer.music.set_volume(MUSIC_VOLUME)
+            if self.file_exists(filepath):
+                self.music.load(filepath)
+                self.music.set_volume(self.music_volume)
                 
                 if fade_in > 0:
-                    pygame.mixer.music.play(loop, fade_ms=fade_in)
+                    self.music.play(loop, fade_ms=fade_in)
                 else:
-                    pygame.mixer.music.play(loop)
+                    self.music.play(loop)
                 
-                self.music_playing = True
                 self.current_music_file = filepath
                 print(f"✓ Playing music: {os.path.basename(filepath)}")
             else:
@@ -262,11 +407,10 @@ class SoundManager:
         """Stop background music with optional fade-out"""
         try:
             if fade_out > 0:
-                pygame.mixer.music.fadeout(fade_out)
+                self.music.fadeout(fade_out)
             else:
-                pygame.mixer.music.stop()
+                self.music.stop()
             
-            self.music_playing = False
             self.current_music_file = None
         except Exception as e:
             print(f"⚠ Warning: Could not stop music: {e}")
@@ -274,14 +418,14 @@ class SoundManager:
     def pause_music(self):
         """Pause background music"""
         try:
-            pygame.mixer.music.pause()
+            self.music.pause()
         except Exception as e:
             print(f"⚠ Warning: Could not pause music: {e}")
     
     def resume_music(self):
         """Resume paused music"""
         try:
-            pygame.mixer.music.unpause()
+            self.music.unpause()
         except Exception as e:
             print(f"⚠ Warning: Could not resume music: {e}")
     
@@ -297,10 +441,10 @@ class SoundManager:
         self.music_muted = not self.music_muted
         
         if self.music_muted:
-            pygame.mixer.music.set_volume(0)
+            self.music.set_volume(0)
             print("🔇 Music muted")
         else:
-            pygame.mixer.music.set_volume(MUSIC_VOLUME)
+            self.music.set_volume(self.music_volume)
             print("🔊 Music unmuted")
         
         return self.music_muted
@@ -311,31 +455,37 @@ class SoundManager:
         if not self.sound_muted or not self.music_muted:
             self.sound_muted = True
             self.music_muted = True
-            pygame.mixer.music.set_volume(0)
+            self.music.set_volume(0)
             print("🔇 All audio muted")
             return True
         else:
             self.sound_muted = False
             self.music_muted = False
-            pygame.mixer.music.set_volume(MUSIC_VOLUME)
+            self.music.set_volume(self.music_volume)
             print("🔊 All audio unmuted")
             return False
     
     def set_sound_volume(self, volume):
         """Set master sound effects volume (0.0 to 1.0)"""
         volume = max(0.0, min(1.0, volume))
+        if volume == self.sound_volume and not self.volume_overridden:
+            return
+        
+        self.sound_volume = volume
+        self.volume_overridden = False
         for sound in self.sounds.values():
-            if sound:
+            if sound is not None:
                 sound.set_volume(volume)
     
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
         volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(volume)
+        self.music_volume = volume
+        self.music.set_volume(volume)
     
     def is_music_playing(self):
         """Check if music is currently playing"""
-        return pygame.mixer.music.get_busy() and self.music_playing
+        return self.music.get_busy()
     
     def get_sound_status(self):
         """Get current sound system status"""
@@ -347,5 +497,15 @@ class SoundManager:
             'loaded_sounds': list(self.sounds.keys())
         }
 
+# Helpers for the minimal main.py loop
+def create_background():
+    """Full-window road background (shared and read-only; copy before drawing on it)"""
+    return create_road_perspective(WINDOW_WIDTH, WINDOW_HEIGHT, copy=False)
+
+def draw_score(frame, score):
+    """Draw the current score in the top-left corner"""
+    cv2.putText(frame, f"Score: {score}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1.0, WHITE, 2)
+    return frame
+
 # Global sound manager instance
 sound_manager = SoundManager()
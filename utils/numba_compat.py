@@ -0,0 +1,20 @@
+"""
+Optional Numba support for hot numeric helpers
+Falls back to plain Python when Numba is not installed
+"""
+
+# Re-exported for the modules that compile with Numba
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,165 @@
+"""
+Shared setup and capture loop for the camera test scripts; import it before opening any VideoCapture
+"""
+
+import os
+import platform
+import signal
+import sys
+import threading
+import time
+from collections import deque
+
+import cv2
+
+# Ask FFmpeg not to buffer or probe network streams; must be set before any VideoCapture opens
+os.environ.setdefault('OPENCV_FFMPEG_CAPTURE_OPTIONS',
+                      'fflags;nobuffer|flags;low_delay|probesize;32|analyzeduration;0')
+
+# Use the vectorized kernels and a fixed thread count; OpenCV's automatic count
+# oversubscribes hyper-threaded hosts and is slower on small ARM boards
+cv2.setUseOptimized(True)
+machine = platform.machine().lower()
+cv2.setNumThreads(1 if machine.startswith(('arm', 'aarch')) else max(1, (os.cpu_count() or 2) // 2))
+
+# Gesture classification works fine at 640x480; larger frames only cost decode time
+STREAM_WIDTH, STREAM_HEIGHT = 640, 480
+
+def low_resolution_url(url):
+    """Ask IP Webcam for a STREAM_WIDTH x STREAM_HEIGHT stream when no path is given"""
+    url = url.rstrip('/')
+    if url.count('/') == 2:  # just scheme://host:port
+        url += f'/video?resolution={STREAM_WIDTH}x{STREAM_HEIGHT}'
+    return url
+
+def downscale(frame):
+    """Shrink frames the server sent at a higher resolution than requested"""
+    height, width = frame.shape[:2]
+    if width <= STREAM_WIDTH:
+        return frame
+    size = (STREAM_WIDTH, round(height * STREAM_WIDTH / width))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+def flush_log(log):
+    """Write all buffered log lines to stdout in one call"""
+    if log:
+        sys.stdout.write('\n'.join(log) + '\n')
+        sys.stdout.flush()
+        log.clear()
+
+def configure_stream(controller):
+    """Keep only the newest frame queued and take the MJPEG stream as-is"""
+    controller.set_buffer_size(1)
+    controller.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    controller.cap.set(cv2.CAP_PROP_FRAME_WIDTH, STREAM_WIDTH)
+    controller.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, STREAM_HEIGHT)
+    print(f"📦 Capture buffer size: {controller.cap.get(cv2.CAP_PROP_BUFFERSIZE):.0f}")
+
+def run_capture_loop(controller, reader, window_name, snapshot_path,
+                     skip_frames=2, headless=False, duration=30):
+    """Run gesture recognition on frames from reader until quit, Ctrl+C or the headless deadline"""
+    print("\n🤲 Gesture Recognition Test:")
+    print("- Make a FIST to trigger JUMP gesture")
+    print("- Show 1 FINGER to trigger CROUCH gesture") 
+    print("- Show OPEN HAND for IDLE gesture")
+    print("- Press 'q' to quit")
+    print("- Press 'd' to toggle debug display")
+    print("- Press 'ESC' to exit")
+    
+    if headless:
+        print(f"🖥 Headless mode: running for {duration}s, saving a frame to {snapshot_path} every second")
+    
+    # Main test loop
+    frame_count = 0
+    actions_detected = 0
+    
+    # Decode frames on a background thread so capture overlaps gesture processing
+    reader.start()
+    last_frame_id = 0
+    gesture, confidence = controller.current_gesture, controller.gesture_confidence
+    
+    # Buffer progress lines and write them out once per second
+    log = deque(maxlen=256)
+    last_flush = time.monotonic()
+    tick_frequency = cv2.getTickFrequency()
+    deadline_ticks = int(duration * tick_frequency)
+    start_ticks = last_snapshot = cv2.getTickCount()
+    
+    # Keys are compared on every frame, so resolve them once
+    quit_keys = (ord('q'), 27)  # 'q' or ESC
+    debug_key = ord('d')
+    
+    # Headless runs have no key polling; Ctrl+C or the deadline sets this instead
+    stop = threading.Event()
+    previous_sigint = signal.signal(signal.SIGINT, lambda *_: stop.set()) if headless else None
+    
+    try:
+        while not stop.is_set():
+            # Process the newest frame only
+            raw_frame, frame_id = reader.read(newer_than=last_frame_id)
+            if frame_id == last_frame_id:
+                print("⚠ No frame received from camera")
+                break
+            last_frame_id = frame_id
+            raw_frame = downscale(raw_frame)
+            
+            frame_count += 1
+            
+            # Run the gesture pipeline (on a 160 px wide copy) every Nth frame only; gestures change
+            # far slower than the stream rate, so in between just mirror the frame as processing does
+            if frame_count % skip_frames == 0:
+                frame, gesture, confidence = controller.process_frame_small(raw_frame)
+                action = controller.get_gesture_action()
+            else:
+                frame = cv2.flip(raw_frame, 1)
+                action = None
+            
+            if action:
+                actions_detected += 1
+                log.append(f"🎯 Action #{actions_detected}: {action.upper()} (confidence: {confidence:.2f})")
+            
+            if not headless:
+                # Display frame
+                cv2.imshow(window_name, frame)
+                
+                # Handle keyboard input
+                key = cv2.waitKey(1) & 0xFF
+                if key in quit_keys:
+                    break
+                elif key == debug_key:
+                    debug_status = controller.toggle_debug()
+                    log.append(f"🔧 Debug display: {'ON' if debug_status else 'OFF'}")
+            else:
+                # Save a frame once per second instead of showing every one
+                now = cv2.getTickCount()
+                if now - last_snapshot >= tick_frequency:
+                    cv2.imwrite(snapshot_path, frame)
+                    last_snapshot = now
+                if now - start_ticks >= deadline_ticks:
+                    stop.set()
+            
+            # Log status every 30 frames
+            if frame_count % 30 == 0:
+                log.append(f"📊 Frame {frame_count}: Current gesture = {gesture.value} ({confidence:.2f}), Actions detected = {actions_detected}")
+            
+            if time.monotonic() - last_flush >= 1.0:
+                flush_log(log)
+                last_flush = time.monotonic()
+    
+    except KeyboardInterrupt:
+        print("\n⚠ Test interrupted by user")
+    except Exception as e:
+        print(f"❌ Error during test: {e}")
+    finally:
+        # Cleanup
+        if previous_sigint is not None:
+            signal.signal(signal.SIGINT, previous_sigint)
+        flush_log(log)
+        reader.stop()
+        controller.cleanup()
+        cv2.destroyAllWindows()
+        elapsed = (cv2.getTickCount() - start_ticks) / tick_frequency
+        print(f"\n✅ Test completed! Detected {actions_detected} gesture actions")
+        print(f"📈 Average: {frame_count / max(elapsed, 1e-6):.1f} FPS over {frame_count} frames")
+    
+    return actions_detected